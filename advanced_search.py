@@ -1,27 +1,54 @@
-import logging
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from urllib.parse import urlencode
-import time
+from selenium.common.exceptions import TimeoutException
+from urllib.parse import urlencode, urljoin
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
-import glob
+import re
+import json
+import time
 import shutil
+import argparse
+import threading
 
 # Import existing functions
-from scraper import setup_driver, login_with_selenium, log
+from scraper import (
+    setup_driver,
+    ensure_logged_in,
+    get_driver_pool,
+    close_driver_pool,
+    navigate,
+    log,
+)
+from report_catalogue import ReportCatalogue
+from html_parser import REPORT_RESULTS, make_soup
+from logging_config import configure_logging
+from downloads import isolated_download_dir, wait_for_download
 
 SOURCE_FOLDER = os.path.abspath("statista_data")
 
 # Define the base URL for Statista because, apparently, hardcoding is still cool sometimes
 BASE_URL = "https://www.statista.com/studies-and-reports/all-reports"
+SORT_BY_RELEVANCE = "idRelevance"
+SORT_BY_DATE = "idDate"  # Newest reports first, used by the incremental sync
+PUBLISHED_FORMATS = ("%b %Y", "%B %Y", "%b %d, %Y", "%d %b %Y", "%Y")
+REPORT_DOWNLOAD_WORKERS = 2  # Reports downloaded at the same time
+REPORT_DOWNLOAD_TIMEOUT = 60  # Seconds a report download may go without progress
+REPORT_INDEX = "reports.json"  # URL -> title / file mapping in advanced_reports
 failed_reports = 0
+_failed_lock = threading.Lock()
+
+# Local full-text index of every report listing crawled so far
+report_catalogue = ReportCatalogue()
 
 
-def construct_url(topic=None, page=1):
+def construct_url(topic=None, page=1, sort_method=SORT_BY_RELEVANCE):
     """
     Construct the dynamic URL based on the provided topic and page number.
     If no topic is provided, return the default page URL.
+    :param sort_method: SORT_BY_RELEVANCE or SORT_BY_DATE.
     """
     params = {
         "idCountry": 0,
@@ -29,7 +56,7 @@ def construct_url(topic=None, page=1):
         "idLanguage": 0,
         "reportType": 0,
         "documentTypes[]": "xls",
-        "sortMethod": "idRelevance",
+        "sortMethod": sort_method,
         "p": page,  # page
     }
     if topic:
@@ -37,84 +64,370 @@ def construct_url(topic=None, page=1):
     return f"{BASE_URL}?{urlencode(params)}"
 
 
-def extract_report_results(driver, topic):
-    """Extract and display report results with title, URL, and published date."""
-    log.info(f'🔍 2/2 Searching for reports related to: "{topic}"...')
+def parse_report_results(html, page_url=BASE_URL):
+    """
+    Extract every report of a results page in one pass over its HTML.
+    :return: List of {"title", "url", "published_in"} dicts in page order.
+    """
     reports = []
-    try:
-        total_results = 0
-        page = 1
+    for result in make_soup(html, REPORT_RESULTS).find_all(class_="reportResult"):
+        if not result.get("href"):
+            continue  # Not a link to a report
+        heading = result.find("h3")
+        # get_text() also sees labels with nested markup, like the old XPath text() match
+        label = next(
+            (
+                span
+                for span in result.find_all("span")
+                if "Published in" in span.get_text()
+            ),
+            None,
+        )
+        published_in = label.find_next_sibling("span") if label else None
+        reports.append(
+            {
+                "title": heading.get_text(strip=True) if heading else "",
+                "url": urljoin(page_url, result["href"]),
+                "published_in": (
+                    published_in.get_text(strip=True) if published_in else "N/A"
+                ),
+            }
+        )
+    return reports
 
-        while True:
-            # Construct the URL for the current page
-            page_url = construct_url(topic, page)
-            log.info(f"   Navigating to page {page}")
-            driver.get(page_url)
 
-            # Try to load the report results; exit if no results are found
-            try:
-                results = WebDriverWait(driver, 5).until(
-                    EC.presence_of_all_elements_located((By.CLASS_NAME, "reportResult"))
-                )
-            except Exception:
-                log.info(f"   ⚠️ No results found on page {page}. Stopping pagination.")
-                break
-
-            if not results:
-                log.info("No more results found.")
-                break
-
-            total_results += len(results)
-            log.info(f"🎉 Found {total_results} reports for {topic}")
-
-            for result in results:
-                # Extract the URL
-                url = result.get_attribute("href")
-                title = result.find_element(By.TAG_NAME, "h3").text.strip()
-
-                # Extract the publication date
-                published_in_element = result.find_element(
-                    By.XPATH,
-                    ".//span[contains(text(),'Published in')]/following-sibling::span",
-                )
-                published_in = (
-                    published_in_element.text.strip() if published_in_element else "N/A"
-                )
+def published_date(report):
+    """Parse a report's 'Published in' text; None if it is missing or unknown."""
+    text = (report.get("published_in") or "").strip()
+    for date_format in PUBLISHED_FORMATS:
+        try:
+            return datetime.strptime(text, date_format)
+        except ValueError:
+            continue
+    return None
 
-                reports.append(
-                    {"title": title, "url": url, "published_in": published_in}
-                )
 
-                print(f"Title: {title}")
-                print(f"URL: {url}")
-                print(f"Published in: {published_in}")
-                print("-" * 50)
+def iter_report_pages(driver, topic, sort_method=SORT_BY_RELEVANCE):
+    """
+    Paginate through the report results and yield the new reports of every
+    page as soon as it is parsed. Returns at the end of the listing.
+    :raises TimeoutException: A page was still loading when the wait ran out,
+        so the listing may be incomplete.
+    """
+    seen = set()
+    page = 1
+    while True:
+        # Construct the URL for the current page
+        page_url = construct_url(topic, page, sort_method)
+        log.info(f"   Navigating to page {page}")
+        navigate(driver, page_url)
+
+        # Wait for the results to render; a fully loaded page without any
+        # result is the end of the listing, a page still loading is not
+        try:
+            WebDriverWait(driver, 5).until(
+                EC.presence_of_element_located((By.CLASS_NAME, "reportResult"))
+            )
+        except TimeoutException:
+            if driver.execute_script("return document.readyState") != "complete":
+                raise TimeoutException(f"Results page {page} did not finish loading.")
+            log.info(f"   ⚠️ No results found on page {page}. Stopping pagination.")
+            return
+
+        # One round trip for the whole page instead of three per result
+        results = parse_report_results(driver.page_source, page_url)
+        if not results:
+            log.info("No more results found.")
+            return
 
-            page += 1
-        report_count = len(reports)
+        new_results = [report for report in results if report["url"] not in seen]
+        if not new_results:
+            # Out-of-range pages may repeat the last page instead of coming back empty
+            log.info(f"   Page {page} repeats earlier results. Stopping pagination.")
+            return
+        seen.update(report["url"] for report in new_results)
+        yield new_results
+        page += 1
 
-        return reports, report_count
 
+def extract_report_results(driver, topic):
+    """Extract report results with title, URL, and published date.
+    :return: (list of report dicts, number of reports)"""
+    log.info(f'🔍 2/2 Searching for reports related to: "{topic}"...')
+    reports = []
+    started = time.time()
+    try:
+        for results in iter_report_pages(driver, topic):
+            reports.extend(results)
+            report_catalogue.add(results, topic)
+            log.info(f"🎉 Found {len(reports)} reports for {topic}")
+        report_catalogue.mark_crawled(topic, started)
+        return reports, len(reports)
+
+    except TimeoutException as e:
+        log.warning(f"⚠️ Report listing incomplete, not caching it: {e.msg}")
+        return reports, len(reports)
     except Exception as e:
         log.error(f"An error occurred while extracting report results: {e}")
         return reports, 0
 
 
-def download_reports(driver, reports, topic):
+def discover_and_download_reports(driver, topic, workers=REPORT_DOWNLOAD_WORKERS):
+    """
+    Search for reports and download them while pagination is still running:
+    every results page is handed to the download workers as soon as it is parsed.
+    :param driver: Logged-in driver used for the search; downloads use pooled drivers.
+    :param workers: Number of reports downloaded at the same time.
+    :return: List of discovered reports.
+    """
+    log.info(f'🔍 Searching and downloading reports related to: "{topic}"...')
+    reports = []
+    started = time.time()
+    with ReportDownloader(topic, workers=workers) as downloader:
+        try:
+            for results in iter_report_pages(driver, topic):
+                reports.extend(results)
+                report_catalogue.add(results, topic)
+                log.info(f"🎉 Found {len(reports)} reports, downloading...")
+                downloader.submit(results)
+            report_catalogue.mark_crawled(topic, started)
+        except TimeoutException as e:
+            log.warning(f"⚠️ Report listing incomplete, not caching it: {e.msg}")
+        except Exception as e:
+            log.error(f"An error occurred while extracting report results: {e}")
+    log.info(f"📊 Downloaded {downloader.downloaded} of {len(reports)} reports.")
+    return reports
+
+
+def cached_extract_report_results(driver, topic, refresh=False):
+    """extract_report_results answered from the local report catalogue when the
+    topic's listing was crawled within the catalogue's TTL.
+    :param refresh: Crawl the live site even if the catalogue is fresh."""
+    if refresh or not report_catalogue.is_fresh(topic):
+        return extract_report_results(driver, topic)
+    reports = report_catalogue.listing(topic)
+    log.info(f"⚡ Using {len(reports)} reports from the local catalogue.")
+    return reports, len(reports)
+
+
+def sync_reports(driver, topic, workers=REPORT_DOWNLOAD_WORKERS):
+    """
+    Download only the reports published since the last sync. The listing is
+    paginated newest first and pagination stops at the first page on which
+    every report is already downloaded (recorded in reports.json). Reports
+    whose download failed stay new and are tried again by the next sync.
+    Stopping early is only safe if the listing really is newest first, so the
+    publication dates are checked on every page; when they are missing or out
+    of order, every page is read instead.
+    :param driver: Logged-in driver used for the listing; downloads use pooled drivers.
+    :return: List of new reports.
+    """
+    log.info(f'🔄 Syncing reports related to: "{topic}"...')
+    files = ReportFiles(topic)
+    new_reports = []
+    pages = 0
+    newest_first = True
+    last_date = None
+    with ReportDownloader(topic, files, workers) as downloader:
+        try:
+            for results in iter_report_pages(driver, topic, SORT_BY_DATE):
+                pages += 1
+                for date in filter(None, map(published_date, results)):
+                    if newest_first and last_date and date > last_date:
+                        log.warning(
+                            "⚠️ Listing is not sorted by date, reading every page."
+                        )
+                        newest_first = False
+                    last_date = date
+                fresh = [
+                    report
+                    for report in results
+                    if not files.is_downloaded(report["url"])
+                ]
+                report_catalogue.add(results, topic, listed=False)
+                new_reports.extend(fresh)
+                downloader.submit(fresh)
+                if not fresh and newest_first and last_date:
+                    log.info(f"⏹️ Page {pages} holds only downloaded reports, stopping.")
+                    break
+        except Exception as e:
+            log.error(f"An error occurred while syncing report results: {e}")
+    log.info(
+        f"📊 Sync found {len(new_reports)} new reports on {pages} pages, "
+        f"downloaded {downloader.downloaded}."
+    )
+    return new_reports
+
+
+def report_folder(topic):
+    """Return the advanced_reports folder of a topic."""
+    # Sanitize the topic name to ensure consistency
+    sanitized_topic = (topic or "all-reports").lower().replace(" ", "-").strip()
+    return os.path.abspath(f"statista_data/{sanitized_topic}/advanced_reports")
+
+
+def sanitize_title(title):
+    """Turn a report title into a file name that is valid on every platform."""
+    sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "-", title).strip(" .")
+    return sanitized[:150] or "report"
+
+
+class ReportFiles:
+    """
+    Title-to-file mapping of a topic's advanced reports. A file name is
+    reserved under a lock before its download starts, so reports sharing a
+    title never overwrite each other, even when several finish at once. The
+    mapping is saved as reports.json next to the files.
+    """
+
+    def __init__(self, topic):
+        self.folder = report_folder(topic)
+        self.path = os.path.join(self.folder, REPORT_INDEX)
+        self._lock = threading.Lock()
+        self.entries = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as file:
+                    self.entries = json.load(file)
+            except (OSError, ValueError) as e:
+                log.warning(f"⚠️ Ignoring unreadable report index {self.path}: {e}")
+        self._stems = {
+            url: os.path.splitext(entry["file"])[0]
+            for url, entry in self.entries.items()
+        }
+
+    def is_downloaded(self, url):
+        entry = self.entries.get(url)
+        return entry is not None and os.path.isfile(
+            os.path.join(self.folder, entry["file"])
+        )
+
+    def reserve(self, report):
+        """Return the file name (without extension) the report is saved under."""
+        url = report["url"]
+        with self._lock:
+            if url in self._stems:
+                return self._stems[url]
+            taken = {stem.lower() for stem in self._stems.values()}
+            title = sanitize_title(report["title"])
+            study_id = re.search(r"/study/(\d+)", url)
+            candidates = [f"{title} adv"]
+            if study_id:
+                candidates.append(f"{title} ({study_id.group(1)}) adv")
+            stem = next((c for c in candidates if c.lower() not in taken), None)
+            counter = 2
+            while stem is None:
+                if f"{title} ({counter}) adv".lower() not in taken:
+                    stem = f"{title} ({counter}) adv"
+                counter += 1
+            self._stems[url] = stem
+            return stem
+
+    def record(self, report, path):
+        """Remember which file a report was saved as."""
+        with self._lock:
+            self.entries[report["url"]] = {
+                "title": report["title"],
+                "published_in": report.get("published_in"),
+                "file": os.path.basename(path),
+                "downloaded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            }
+            os.makedirs(self.folder, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(self.entries, file, indent=2)
+            os.replace(temp_path, self.path)
+
+
+class ReportDownloader:
+    """
+    Download reports with browsers from the shared driver pool while the caller
+    keeps submitting more. Leaving the `with` block waits for every download; a
+    download that raises (e.g. no browser could be started) counts as failed
+    instead of aborting the others.
+    """
+
+    def __init__(self, topic, files=None, workers=REPORT_DOWNLOAD_WORKERS):
+        self.topic = topic
+        self.files = files or ReportFiles(topic)
+        self.workers = workers
+        self.downloaded = 0
+        self._futures = []
+        self._executor = None
+
+    def __enter__(self):
+        get_driver_pool(size=self.workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="report"
+        )
+        return self
+
+    def submit(self, reports):
+        self._futures += [
+            self._executor.submit(download_report, None, report, self.topic, self.files)
+            for report in reports
+        ]
+
+    def __exit__(self, *exc_info):
+        global failed_reports
+
+        try:
+            for future in as_completed(self._futures):
+                try:
+                    self.downloaded += bool(future.result())
+                except Exception as e:
+                    with _failed_lock:
+                        failed_reports += 1
+                    log.error(f"An error occurred while downloading a report: {e}")
+        finally:
+            self._executor.shutdown()
+        return False
+
+
+def download_reports(
+    driver, reports, topic, workers=REPORT_DOWNLOAD_WORKERS, files=None
+):
     """
     Visit each report URL, download the corresponding file, and move it to the destination folder immediately.
-    :param driver: Selenium WebDriver instance.
+    :param driver: Selenium WebDriver instance used for every report, or None to download
+        `workers` reports at the same time with browsers from the shared driver pool.
     :param reports: List of report dictionaries containing 'url' and 'title'.
+    :return: Number of reports downloaded.
+    """
+    files = files or ReportFiles(topic)
+    if driver is not None:
+        return sum(download_report(driver, report, topic, files) for report in reports)
+
+    with ReportDownloader(topic, files, workers) as downloader:
+        downloader.submit(reports)
+    log.info(f"📊 Downloaded {downloader.downloaded} of {len(reports)} reports.")
+    return downloader.downloaded
+
+
+def download_report(driver, report, topic, files=None):
+    """
+    Download a single report into the topic's advanced_reports folder.
+    :param driver: Selenium WebDriver instance, or None to borrow one from the shared driver pool.
+    :param files: Shared ReportFiles of the topic, so parallel downloads get unique names.
+    :return: True if the report was downloaded (or already was).
     """
     global failed_reports
 
-    if not os.path.exists(SOURCE_FOLDER):
-        os.makedirs(SOURCE_FOLDER)
+    files = files or ReportFiles(topic)
+    url = report["url"]
+    if files.is_downloaded(url):
+        log.info(f"⏭️ Report already downloaded: {report['title']}")
+        return True
 
-    for report in reports:
-        try:
-            url = report["url"]
-            driver.get(url)
+    if driver is None:
+        with get_driver_pool().driver() as pooled_driver:
+            return download_report(pooled_driver, report, topic, files)
+
+    stem = files.reserve(report)
+    try:
+        # Each report lands in its own folder, so its file cannot be mistaken for another
+        with isolated_download_dir(driver) as download_dir:
+            navigate(driver, url)
 
             # Wait for the download button to be present
             download_button = WebDriverWait(driver, 10).until(
@@ -127,16 +440,19 @@ def download_reports(driver, reports, topic):
             log.info(f"✅ Downloading report on page: {url}")
             download_button.click()
 
-            # Wait for download to complete
-            time.sleep(
-                2
-            )  # Adjust timeout as needed based on file size and download speed
-
-            # Move and rename the file proactively
-            move_latest_file_to_destination(report["title"], topic)
-        except Exception as e:
+            # Move and rename the file as soon as the download has completed
+            dest_path = move_latest_file_to_destination(
+                report["title"], topic, download_dir, dest_stem=stem
+            )
+        if dest_path is None:
+            raise RuntimeError("The report file did not arrive.")
+        files.record(report, dest_path)
+        return True
+    except Exception as e:
+        with _failed_lock:
             failed_reports += 1
-            log.error(f"An error occurred while downloading from {url}: {e}")
+        log.error(f"An error occurred while downloading from {url}: {e}")
+        return False
 
 
 def get_failed_reports_downloads():
@@ -144,84 +460,99 @@ def get_failed_reports_downloads():
     return failed_reports
 
 
-def move_latest_file_to_destination(title, topic):
+def move_latest_file_to_destination(
+    title, topic, source_folder=SOURCE_FOLDER, dest_stem=None
+):
     """
-    Move the latest downloaded file from the 'statista_data' folder to the destination folder
+    Wait for the download in the source folder to complete, then move it to the destination folder
     and rename it based on the report title.
     :param title: The title of the report to use for renaming.
     :param topic: The topic to replace in the destination folder path.
+    :param source_folder: Folder the browser downloads into (ideally private to this download).
+    :param dest_stem: File name without extension reserved for this report (see ReportFiles).
+    :return: Path of the moved file, or None if nothing was moved.
     """
     try:
-        # Sanitize the topic name to ensure consistency
-        sanitized_topic = topic.lower().replace(" ", "-").strip()
-
         # Construct the destination folder path
-        dest_folder = os.path.abspath(
-            f"statista_data/{sanitized_topic}/advanced_reports"
-        )
+        dest_folder = report_folder(topic)
 
         # Ensure destination folder exists
         if not os.path.exists(dest_folder):
             os.makedirs(dest_folder)
             log.info(f"📂 Created folder: {dest_folder}")
 
-        # Find the latest downloaded file in the source folder
-        files = glob.glob(os.path.join(SOURCE_FOLDER, "*.xlsx"))
-        if not files:
-            log.warning(f"No files found in {SOURCE_FOLDER} to move.")
-            return
-
-        latest_file = max(files, key=os.path.getctime)
-        file_name = os.path.basename(latest_file)
+        # Wait for the completed download in the source folder
+        try:
+            latest_file = wait_for_download(
+                source_folder, ("*.xls*",), timeout=REPORT_DOWNLOAD_TIMEOUT
+            )
+        except TimeoutError:
+            log.warning(f"No files found in {source_folder} to move.")
+            return None
 
-        # Generate a new name based on the report title
-        sanitized_title = title.replace("/", "-").replace("\\", "-").strip()
-        new_name = f"{sanitized_title} adv.xlsx"
-        dest_path = os.path.join(dest_folder, new_name)
+        # Generate a new name based on the report title, keeping the real extension
+        stem = dest_stem or f"{sanitize_title(title)} adv"
+        extension = os.path.splitext(latest_file)[1]
+        dest_path = os.path.join(dest_folder, f"{stem}{extension}")
 
         # Move the file to the destination folder
         shutil.move(latest_file, dest_path)
         log.info(f"✅ Moved file to {dest_path}")
+        return dest_path
     except Exception as e:
         log.error(f"❌ Failed to move and rename file: {e}")
+        return None
 
 
-def open_xlsx_report_page(topic):
+def open_xlsx_report_page(topic, sync=False):
     """
     Navigate to the dynamically constructed XLSX report page and download the reports.
     Then move and rename the downloaded files.
     :param topic: The topic to search for in the reports. Defaults to None.
+    :param sync: Only download reports published since the last sync.
     """
     driver = setup_driver()
     try:
         log.info("Starting login process...")
-        if not login_with_selenium(driver):
+        if not ensure_logged_in(driver):
             log.error("Login failed. Exiting script.")
             return
 
-        # Extract report results
-        reports, _ = extract_report_results(driver, topic)
-        log.info(f"Total reports found: {len(reports)}")
-
-        # Download reports
-        download_reports(driver, reports, topic)
+        if sync:
+            reports = sync_reports(driver, topic)
+            log.info(f"New reports since the last sync: {len(reports)}")
+        else:
+            # Download reports while the result pages are still being searched
+            reports = discover_and_download_reports(driver, topic)
+            log.info(f"Total reports found: {len(reports)}")
 
     except Exception as e:
         log.error(f"An error occurred: {e}")
     finally:
+        close_driver_pool()
         driver.quit()
 
 
-if __name__ == "__main__":
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+def parse_args(argv=None):
+    """Parse command-line options for the advanced report downloader."""
+    parser = argparse.ArgumentParser(description="Statista advanced report search.")
+    parser.add_argument("topic", nargs="?", help="Topic to search reports for.")
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Only download reports published since the last sync.",
     )
-    log = logging.getLogger()
+    return parser.parse_args(argv)
 
-    # Prompt the user for a topic (will be removed later, needs to be integrated into the gui)
-    topic = input(
-        "Enter a topic to search (or press Enter to load the default page): "
-    ).strip()
-    open_xlsx_report_page(topic if topic else None)
+
+if __name__ == "__main__":
+    args = parse_args()
+    configure_logging()
+
+    topic = args.topic
+    if topic is None:
+        # Prompt the user for a topic (will be removed later, needs to be integrated into the gui)
+        topic = input(
+            "Enter a topic to search (or press Enter to load the default page): "
+        ).strip()
+    open_xlsx_report_page(topic if topic else None, sync=args.sync)
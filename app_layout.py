@@ -2,6 +2,8 @@ import os
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
+from scheduler import DEFAULT_CONCURRENCY, MAX_CONCURRENCY
+
 
 # Define styles for active and inactive cards
 active_card_style = {
@@ -371,6 +373,36 @@ app_layout = dbc.Container(
                                                                 ),
                                                                 width="2",
                                                             ),
+                                                            dbc.Col(
+                                                                html.Div(
+                                                                    [
+                                                                        dbc.Checkbox(
+                                                                            id="refresh-search-checkbox",
+                                                                            value=False,
+                                                                            className="me-1",
+                                                                        ),
+                                                                        dbc.Label(
+                                                                            "Refresh",
+                                                                            html_for="refresh-search-checkbox",
+                                                                            className="mb-0",
+                                                                            style={
+                                                                                "cursor": "pointer"
+                                                                            },
+                                                                            id="refresh-search-label",
+                                                                        ),
+                                                                        dbc.Tooltip(
+                                                                            "Ignore cached results of earlier identical searches and search Statista again.",
+                                                                            target="refresh-search-label",
+                                                                            placement="bottom",
+                                                                            style={
+                                                                                "font-size": "0.9rem"
+                                                                            },
+                                                                        ),
+                                                                    ],
+                                                                    className="d-flex align-items-center mb-2",
+                                                                ),
+                                                                width="auto",
+                                                            ),
                                                             dbc.Col(
                                                                 html.Div(
                                                                     "Max results",
@@ -518,6 +550,27 @@ app_layout = dbc.Container(
                                                                 ),
                                                                 width="auto",
                                                             ),
+                                                            dbc.Col(
+                                                                html.Div(
+                                                                    "Parallel downloads",
+                                                                    className="d-flex align-items-center mb-3",
+                                                                ),
+                                                                width="auto",
+                                                            ),
+                                                            dbc.Col(
+                                                                dbc.Input(
+                                                                    id="concurrency-input",
+                                                                    type="number",
+                                                                    value=DEFAULT_CONCURRENCY,
+                                                                    min=1,
+                                                                    max=MAX_CONCURRENCY,
+                                                                    className="mb-3",
+                                                                    style={
+                                                                        "width": "80px"
+                                                                    },
+                                                                ),
+                                                                width="auto",
+                                                            ),
                                                         ],
                                                         align="center",
                                                         justify="start",
@@ -0,0 +1,224 @@
+"""
+Non-interactive batch scraping of many topics.
+
+Usage (from the repository root):
+    python batch.py France Germany https://www.statista.com/topics/1234/example/
+    python batch.py --file topics.txt --topic-workers 2 --concurrency 2
+
+Every input is either a topic URL or a search query. Queries are resolved with
+the (cached) topic search, the resulting topics are de-duplicated and scraped
+side by side over the shared driver pool. A JSON summary of the run is written
+at the end.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from scheduler import DEFAULT_CONCURRENCY, clamp_concurrency
+from scraper import (
+    log,
+    setup_driver,
+    ensure_logged_in,
+    get_driver_pool,
+    close_driver_pool,
+    cached_search_topic,
+    get_files_to_be_downloaded_many,
+    scrape_topic,
+    page_load_stats,
+    telemetry,
+)
+from logging_config import configure_logging
+
+DEFAULT_TOPIC_WORKERS = 2  # Topics scraped at the same time
+MAX_TOPIC_WORKERS = 4  # Each topic worker runs up to --concurrency browsers
+SUMMARY_FILE = "batch_summary.json"
+
+
+def read_inputs(items, path=None):
+    """
+    Collect queries / topic URLs from the command line and an optional file
+    (one per line, blank lines and lines starting with '#' are ignored).
+    """
+    inputs = list(items)
+    if path:
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    inputs.append(line)
+    return inputs
+
+
+def is_topic_url(item):
+    return item.startswith(("http://", "https://"))
+
+
+def resolve_topics(inputs, strict_match=True, max_results=100, refresh=False):
+    """
+    Turn queries and URLs into a de-duplicated list of topic URLs.
+    :return: (topic URLs in input order, {input: [resolved URLs]})
+    """
+    resolved = {}
+    queries = [item for item in inputs if not is_topic_url(item)]
+    if queries:
+        with get_driver_pool().driver() as driver:
+            for query in queries:
+                log.info(f"\n===== RESOLVING QUERY: {query} =====")
+                topics = cached_search_topic(
+                    driver, query, strict_match, max_results, refresh
+                )
+                resolved[query] = [url for _, url in topics]
+                if not topics:
+                    log.warning(f"⚠️ No topics found for '{query}'.")
+
+    topic_urls = []
+    for item in inputs:
+        topic_urls.extend([item] if is_topic_url(item) else resolved[item])
+        resolved.setdefault(item, [item])
+    return list(dict.fromkeys(topic_urls)), resolved
+
+
+def scrape_topics(topic_urls, topic_workers, concurrency):
+    """Scrape topics in parallel; returns the per-topic summaries in input order."""
+    summaries = {}
+    with ThreadPoolExecutor(
+        max_workers=topic_workers, thread_name_prefix="topic"
+    ) as executor:
+        futures = {
+            executor.submit(scrape_topic, url, concurrency): url for url in topic_urls
+        }
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                summaries[url] = future.result()
+            except Exception as e:
+                log.error(f"❌ Scraping {url} failed: {e}")
+                summaries[url] = {"topic_url": url, "status": "failed", "error": str(e)}
+            log.info(f"🏁 {url}: {summaries[url]['status']}")
+    return [summaries[url] for url in topic_urls]
+
+
+def write_summary(path, summary):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=2)
+    log.info(f"📝 Run summary written to {path}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("items", nargs="*", help="Search queries or topic URLs")
+    parser.add_argument(
+        "-f", "--file", help="File with one query or topic URL per line"
+    )
+    parser.add_argument(
+        "-t",
+        "--topic-workers",
+        type=int,
+        default=DEFAULT_TOPIC_WORKERS,
+        help=f"Number of topics scraped at the same time (1-{MAX_TOPIC_WORKERS}, "
+        f"default: {DEFAULT_TOPIC_WORKERS})",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=clamp_concurrency,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of XLSX downloads per topic (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--max-results",
+        type=int,
+        default=100,
+        help="Maximum number of topics taken from each search (default: 100)",
+    )
+    parser.add_argument(
+        "--loose",
+        action="store_true",
+        help="Keep search results that do not contain the query",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached search results and search the live site again",
+    )
+    parser.add_argument(
+        "-o",
+        "--summary",
+        default=SUMMARY_FILE,
+        help=f"Where to write the JSON run summary (default: {SUMMARY_FILE})",
+    )
+    args = parser.parse_args(argv)
+    if not args.items and not args.file:
+        parser.error("give at least one query / topic URL or --file")
+    args.topic_workers = max(1, min(args.topic_workers, MAX_TOPIC_WORKERS))
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_logging()
+    started = time.time()
+    inputs = read_inputs(args.items, args.file)
+    log.info("=" * 80)
+    log.info(f"          STATISTA BATCH SCRAPER - {len(inputs)} INPUTS")
+    log.info("=" * 80)
+
+    # Log in once; the stored session is reused by every pooled browser
+    driver = setup_driver()
+    try:
+        logged_in = ensure_logged_in(driver)
+    finally:
+        driver.quit()
+    if not logged_in:
+        log.error("❌ Login failed. Exiting.")
+        return 1
+
+    try:
+        # Each topic runs its XLSX downloads plus one report PDF download
+        get_driver_pool(size=args.topic_workers * (args.concurrency + 1))
+        topic_urls, resolved = resolve_topics(
+            inputs, not args.loose, args.max_results, args.refresh
+        )
+        # Fetch every topic page up front and concurrently; scrape_topic then
+        # reads them from the topic page cache
+        section_counts = get_files_to_be_downloaded_many(topic_urls)
+        log.info(
+            f"📊 {len(topic_urls)} unique topics to scrape, "
+            f"{sum(section_counts.values())} sections listed."
+        )
+        topics = scrape_topics(topic_urls, args.topic_workers, args.concurrency)
+        pool_stats = get_driver_pool().stats()
+    finally:
+        close_driver_pool()
+
+    finished = time.time()
+    write_summary(
+        args.summary,
+        {
+            "started": datetime.fromtimestamp(started).isoformat(timespec="seconds"),
+            "finished": datetime.fromtimestamp(finished).isoformat(timespec="seconds"),
+            "duration_seconds": round(finished - started, 1),
+            "topic_workers": args.topic_workers,
+            "concurrency": args.concurrency,
+            "inputs": resolved,
+            "sections_listed": section_counts,
+            "topics": topics,
+            "driver_pool": pool_stats,
+            "page_loads": page_load_stats.summary(),
+            "telemetry": telemetry.report(),
+        },
+    )
+    failed = [topic for topic in topics if topic["status"] != "ok"]
+    if failed:
+        log.warning(f"⚠️ {len(failed)} of {len(topics)} topics did not fully succeed.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+import os
+import time
+import shutil
+import logging
+import threading
+
+from manifest import file_sha256
+from sqlite_store import connect
+
+log = logging.getLogger()
+
+BLOB_FOLDER = os.path.abspath(os.path.join(".cache", "blobs"))
+INDEX_NAME = "index.sqlite"
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS blobs ("
+    " url TEXT PRIMARY KEY,"
+    " sha256 TEXT NOT NULL,"
+    " size INTEGER NOT NULL,"
+    " suffix TEXT NOT NULL,"
+    " stored_at REAL NOT NULL)"
+)
+
+
+def link_file(source, destination):
+    """
+    Make `destination` a hardlink to `source`, replacing whatever is there.
+    Falls back to a copy where hardlinks are not supported (other drive, FAT).
+    """
+    temp_path = f"{destination}.{os.getpid()}-{threading.get_ident()}.link"
+    try:
+        os.link(source, temp_path)
+    except OSError:
+        shutil.copy2(source, temp_path)
+    os.replace(temp_path, destination)
+
+
+class BlobStore:
+    """
+    Content-addressed store for downloaded files. Every file is kept once as
+    `<folder>/<sha256[:2]>/<sha256><suffix>` and topic folders hold hardlinks to
+    it. An SQLite index maps source URLs to hashes, so a statistic seen under
+    another topic is linked instead of downloaded again.
+    """
+
+    def __init__(self, folder=BLOB_FOLDER):
+        self.folder = folder
+        self.linked = 0  # Downloads avoided by linking a known URL
+        self.deduplicated = 0  # Downloaded files whose content was already stored
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        return connect(os.path.join(self.folder, INDEX_NAME), SCHEMA)
+
+    def blob_path(self, digest, suffix=""):
+        return os.path.join(self.folder, digest[:2], f"{digest}{suffix}")
+
+    def add(self, path, url=None):
+        """
+        Move a freshly downloaded file into the store and leave a hardlink in its
+        place. If the same content is already stored, `path` is relinked to it.
+        :param url: Source URL, remembered so the file is never downloaded twice.
+        :return: SHA-256 of the file.
+        """
+        digest = file_sha256(path)
+        size = os.path.getsize(path)
+        suffix = os.path.splitext(path)[1]
+        blob = self.blob_path(digest, suffix)
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+
+        try:
+            os.link(path, blob)
+        except FileExistsError:
+            if not os.path.samefile(blob, path):
+                link_file(blob, path)
+                with self._lock:
+                    self.deduplicated += 1
+        except OSError:  # No hardlinks here: keep a copy in the store
+            if not os.path.exists(blob):
+                shutil.copy2(path, f"{blob}.tmp")
+                os.replace(f"{blob}.tmp", blob)
+
+        if url:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?)",
+                    (url, digest, size, suffix, time.time()),
+                )
+        return digest
+
+    def lookup(self, url):
+        """Return the stored file for `url`, or None if unknown or missing."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT sha256, size, suffix FROM blobs WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        digest, size, suffix = row
+        blob = self.blob_path(digest, suffix)
+        if not os.path.isfile(blob) or os.path.getsize(blob) != size:
+            log.warning(f"⚠️ Stored copy of {url} is missing or damaged, forgetting it.")
+            with self._connect() as connection:
+                connection.execute("DELETE FROM blobs WHERE url = ?", (url,))
+            return None
+        return blob
+
+    def link(self, url, destination):
+        """
+        Link the stored file for `url` to `destination`.
+        :return: SHA-256 of the linked file, or None if it is not stored.
+        """
+        blob = self.lookup(url)
+        if blob is None:
+            return None
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        link_file(blob, destination)
+        with self._lock:
+            self.linked += 1
+        return os.path.splitext(os.path.basename(blob))[0]
+
+    def stats(self):
+        """Return counters of this process and the size of the store."""
+        with self._connect() as connection:
+            urls, blobs = connection.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT sha256) FROM blobs"
+            ).fetchone()
+            stored_bytes = connection.execute(
+                "SELECT COALESCE(SUM(size), 0)"
+                " FROM (SELECT DISTINCT sha256, size FROM blobs)"
+            ).fetchone()[0]
+        return {
+            "linked": self.linked,
+            "deduplicated": self.deduplicated,
+            "urls": urls,
+            "blobs": blobs,
+            "stored_bytes": stored_bytes,
+        }
@@ -0,0 +1,106 @@
+import logging
+import statistics
+import threading
+
+log = logging.getLogger()
+
+LEAN_PAGE_LOAD_STRATEGY = "eager"  # Return once the DOM is ready, not after every image
+BROWSER_CACHE_BYTES = 32 * 1024 * 1024  # Keep Chrome's disk cache small
+
+# Resources the scraper never looks at: images, fonts, media and third-party
+# trackers / ads. Statista's own scripts and the cookie banner are left alone.
+BLOCKED_URL_PATTERNS = [
+    "*.png*",
+    "*.jpg*",
+    "*.jpeg*",
+    "*.gif*",
+    "*.webp*",
+    "*.avif*",
+    "*.ico*",
+    "*.woff*",
+    "*.ttf*",
+    "*.otf*",
+    "*.mp4*",
+    "*.webm*",
+    "*.mp3*",
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*adservice.google.*",
+    "*connect.facebook.net*",
+    "*snap.licdn.com*",
+    "*bat.bing.com*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*criteo.*",
+    "*taboola.com*",
+    "*outbrain.com*",
+]
+
+# Content settings: 2 = block
+LEAN_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+}
+
+
+def apply_lean_options(options, prefs):
+    """
+    Turn Chrome options into a lean profile: eager page loads, no images, a
+    small disk cache and no background networking.
+    :param prefs: Preferences dict that is passed to Chrome afterwards; updated in place.
+    """
+    options.page_load_strategy = LEAN_PAGE_LOAD_STRATEGY
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument(f"--disk-cache-size={BROWSER_CACHE_BYTES}")
+    options.add_argument(f"--media-cache-size={BROWSER_CACHE_BYTES // 4}")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--mute-audio")
+    prefs.update(LEAN_PREFS)
+
+
+def block_urls(driver, patterns=BLOCKED_URL_PATTERNS):
+    """Block matching requests in the browser through the DevTools protocol."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+    except Exception as e:  # Not a Chromium driver
+        log.warning(f"⚠️ Could not block URLs in the browser: {e}")
+
+
+class PageLoadStats:
+    """Thread-safe record of browser navigation times."""
+
+    def __init__(self):
+        self.durations = []
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        with self._lock:
+            self.durations.append(seconds)
+
+    def summary(self):
+        """Return count, mean, median, p95 and max navigation time in seconds."""
+        with self._lock:
+            durations = sorted(self.durations)
+        if not durations:
+            return {"count": 0}
+        return {
+            "count": len(durations),
+            "mean": round(statistics.fmean(durations), 3),
+            "median": round(statistics.median(durations), 3),
+            "p95": round(durations[int(0.95 * (len(durations) - 1))], 3),
+            "max": round(durations[-1], 3),
+        }
+
+    def log_summary(self, label="Page loads"):
+        summary = self.summary()
+        if summary["count"]:
+            log.info(
+                f"⏱️ {label}: {summary['count']} navigations, "
+                f"mean {summary['mean']:.2f}s, median {summary['median']:.2f}s, "
+                f"p95 {summary['p95']:.2f}s, max {summary['max']:.2f}s"
+            )
@@ -0,0 +1,134 @@
+import os
+import time
+import logging
+import threading
+from urllib.parse import urljoin
+
+from http_client import fetch_page
+from html_parser import FORMS, XLS_BUTTON, XLS_BUTTON_TRACK, make_soup
+
+log = logging.getLogger()
+
+XLS_BUTTON_MARKER = "paywall_c2a--xls"  # Same marker the Selenium path clicks on
+CHUNK_SIZE = 64 * 1024
+MAX_MISSING_LINKS = 5  # Pages in a row without a direct link before giving up on HTTP
+# Leading bytes of .xlsx (zip container) and legacy .xls (OLE2) files
+SPREADSHEET_SIGNATURES = (b"PK\x03\x04", b"\xd0\xcf\x11\xe0")
+
+
+class DirectLinkSwitch:
+    """
+    Turns the HTTP fast path off once statistic pages keep coming back without
+    a direct XLS link (the button is usually JavaScript-only), so later
+    downloads stop paying a rate-limited request and a parse for nothing.
+    """
+
+    def __init__(self, max_missing=MAX_MISSING_LINKS):
+        self.max_missing = max_missing
+        self.missing = 0  # Pages in a row without a direct link
+        self.enabled = True
+        self._lock = threading.Lock()
+
+    def record(self, found):
+        with self._lock:
+            self.missing = 0 if found else self.missing + 1
+            if self.enabled and self.missing >= self.max_missing:
+                self.enabled = False
+                log.info(
+                    f"↪️ {self.missing} pages in a row had no direct XLSX link, "
+                    "using the browser for the rest of the run."
+                )
+
+
+def find_xlsx_link(html, section_url):
+    """Return the absolute download URL behind the XLS button of a page, or None."""
+    for element in make_soup(html, XLS_BUTTON).find_all(True):
+        for attribute in ("href", "data-href", "data-url", "formaction"):
+            if element.get(attribute):
+                return urljoin(section_url, element[attribute])
+        # The button may submit a form; only then is the rest of the page parsed
+        for form in make_soup(html, FORMS).find_all("form", action=True):
+            if form.find(attrs={"data-paywall-info-box-track": XLS_BUTTON_TRACK}):
+                return urljoin(section_url, form["action"])
+    return None
+
+
+def resolve_xlsx_url(session, section_url, timeout=20):
+    """
+    Find the XLS download URL on a statistic page without a browser.
+    :return: Absolute download URL, or None if the page does not expose one.
+    """
+    page = fetch_page(session, section_url, timeout=timeout)
+    if page.status_code != 200 or XLS_BUTTON_MARKER not in page.text:
+        return None
+    return find_xlsx_link(page.text, section_url)
+
+
+def stream_to_file(session, url, save_path, referer=None, timeout=30, sample=None):
+    """
+    Stream a spreadsheet to `save_path` in chunks. The file is written to a
+    `.part` sibling first and only renamed once it is complete.
+    :param sample: Optional telemetry sample receiving the time to first byte.
+    :return: Number of bytes written.
+    :raises ValueError: If the server answers with something that is not a spreadsheet.
+    """
+    headers = {"Referer": referer} if referer else {}
+    partial_path = f"{save_path}.part"
+    written = 0
+
+    with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+        if sample is not None:
+            # With stream=True, elapsed stops once the headers have arrived
+            sample.ttfb = response.elapsed.total_seconds()
+        response.raise_for_status()
+        if "text/html" in response.headers.get("Content-Type", ""):
+            raise ValueError("Received an HTML page instead of a spreadsheet.")
+
+        try:
+            with open(partial_path, "wb") as file:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if not chunk:
+                        continue
+                    if written == 0 and not chunk.startswith(SPREADSHEET_SIGNATURES):
+                        raise ValueError("Response is not an Excel file.")
+                    file.write(chunk)
+                    written += len(chunk)
+            if written == 0:
+                raise ValueError("Received an empty file.")
+            os.replace(partial_path, save_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+    return written
+
+
+def download_xlsx_direct(session, section_url, save_path, sample=None, switch=None):
+    """
+    Try to download the XLSX of a statistic page over plain HTTP.
+    :param sample: Optional telemetry sample receiving page time, TTFB and size.
+    :param switch: Optional DirectLinkSwitch told whether the page had a direct link.
+    :return: True on success, False if the caller should fall back to Selenium.
+    """
+    try:
+        start = time.monotonic()
+        download_url = resolve_xlsx_url(session, section_url)
+        if sample is not None:
+            sample.navigation = time.monotonic() - start
+        if switch is not None:
+            switch.record(download_url is not None)
+        if not download_url:
+            log.info(f"↪️ No direct XLSX link on {section_url}, using the browser.")
+            return False
+        size = stream_to_file(
+            session, download_url, save_path, referer=section_url, sample=sample
+        )
+        if sample is not None:
+            sample.bytes = size
+        log.info(f"⚡ Downloaded {size} bytes without a browser: {section_url}")
+        return True
+    except Exception as e:
+        log.info(
+            f"↪️ Direct XLSX download failed for {section_url} ({e}), using the browser."
+        )
+        return False
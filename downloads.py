@@ -0,0 +1,92 @@
+import os
+import glob
+import time
+import shutil
+import logging
+import tempfile
+from contextlib import contextmanager
+
+log = logging.getLogger()
+
+# Suffixes Chrome (and other browsers) use for files that are still being written
+PARTIAL_SUFFIXES = (".crdownload", ".part", ".tmp")
+
+
+def set_download_dir(driver, directory):
+    """Point all further downloads of a Chrome driver to the given directory."""
+    params = {"behavior": "allow", "downloadPath": directory}
+    try:
+        driver.execute_cdp_cmd("Browser.setDownloadBehavior", params)
+    except Exception:
+        # Older Chrome versions only support the per-page command
+        driver.execute_cdp_cmd("Page.setDownloadBehavior", params)
+
+
+@contextmanager
+def isolated_download_dir(driver, prefix="statista-"):
+    """
+    Give a single download its own temporary directory, so concurrent downloads
+    never see each other's files. The directory is removed afterwards.
+    """
+    directory = tempfile.mkdtemp(prefix=prefix)
+    try:
+        set_download_dir(driver, directory)
+        yield directory
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def is_partial(path):
+    """Return True for files that are still being downloaded."""
+    return path.endswith(PARTIAL_SUFFIXES)
+
+
+def _size(path):
+    """Size of a file that may be renamed or removed at any moment."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def wait_for_download(
+    directory, patterns=("*",), timeout=30, poll_interval=0.5, max_wait=600
+):
+    """
+    Wait until a download in `directory` has completed and return its path.
+    A download is complete when no partial file is left and the size of the
+    matching file did not change between two consecutive polls.
+    :param timeout: Seconds to wait without any progress; a growing partial
+        file pushes the deadline back, so slow downloads are not cut off.
+    :param max_wait: Upper bound in seconds regardless of progress.
+    :raises TimeoutError: If no completed file appears in time.
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    last_seen = None
+    last_partial_size = 0
+
+    while time.monotonic() < min(deadline, started + max_wait):
+        entries = glob.glob(os.path.join(directory, "*"))
+        partial_size = sum(_size(entry) for entry in entries if is_partial(entry))
+        if partial_size > last_partial_size:
+            deadline = time.monotonic() + timeout
+        last_partial_size = partial_size
+        if not any(is_partial(entry) for entry in entries):
+            candidates = [
+                path
+                for pattern in patterns
+                for path in glob.glob(os.path.join(directory, pattern))
+                if not is_partial(path)
+            ]
+            if candidates:
+                path = max(candidates, key=os.path.getmtime)
+                size = os.path.getsize(path)
+                if size > 0 and last_seen == (path, size):
+                    return path
+                last_seen = (path, size)
+        time.sleep(poll_interval)
+
+    raise TimeoutError(
+        f"No completed download matching {patterns} in {directory} after {timeout}s."
+    )
@@ -0,0 +1,157 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+log = logging.getLogger()
+
+
+class DriverPool:
+    """
+    Keep a bounded set of warm, authenticated Selenium drivers and hand them out
+    to download workers.
+    :param factory: Callable returning a ready-to-use (logged-in) WebDriver.
+    :param size: Maximum number of drivers alive at the same time.
+    :param max_pages: Number of checkouts after which a driver is recycled.
+    """
+
+    def __init__(self, factory, size=2, max_pages=50):
+        self.factory = factory
+        self.size = size
+        self.max_pages = max_pages
+        self._idle = []  # [(driver, pages_served)]
+        self._in_use = 0
+        self._condition = threading.Condition()
+        self._closed = False
+
+        # Utilisation counters
+        self.created = 0
+        self.recycled = 0
+        self.discarded = 0
+        self.checkouts = 0
+        self.wait_time = 0.0
+        self._busy_since = {}
+        self.busy_time = 0.0
+        self._started_at = time.monotonic()
+
+    def resize(self, size):
+        """Change the maximum number of drivers; idle extras are closed lazily."""
+        with self._condition:
+            self.size = max(1, int(size))
+            self._condition.notify_all()
+
+    def _acquire(self):
+        """Return (driver, pages_served), creating a new driver if there is room."""
+        start = time.monotonic()
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed.")
+                if self._idle:
+                    driver, pages = self._idle.pop()
+                    break
+                if self._in_use < self.size:
+                    driver, pages = None, 0
+                    break
+                self._condition.wait()
+            self._in_use += 1
+            self.checkouts += 1
+            self.wait_time += time.monotonic() - start
+
+        if driver is None:
+            try:
+                driver = self.factory()
+            except Exception:
+                with self._condition:
+                    self._in_use -= 1
+                    self._condition.notify()
+                raise
+            with self._condition:
+                self.created += 1
+            log.info(f"🚗 Started pooled browser ({self.created} created so far).")
+
+        with self._condition:
+            self._busy_since[id(driver)] = time.monotonic()
+        return driver, pages
+
+    def _release(self, driver, pages, broken=False):
+        """Return a driver to the pool, recycling it when worn out or broken."""
+        with self._condition:
+            started = self._busy_since.pop(id(driver), None)
+            if started is not None:
+                self.busy_time += time.monotonic() - started
+            self._in_use -= 1
+            pages += 1
+
+            retire = broken or self._closed or pages >= self.max_pages
+            if not retire and len(self._idle) + self._in_use + 1 > self.size:
+                retire = True  # Pool was shrunk while this driver was out
+            if broken:
+                self.discarded += 1
+            elif retire:
+                self.recycled += 1
+            else:
+                self._idle.append((driver, pages))
+            self._condition.notify()
+
+        if retire:
+            _quit_quietly(driver)
+
+    @contextmanager
+    def driver(self):
+        """
+        Context manager yielding a pooled driver. If the block raises, the driver
+        is considered broken and replaced on the next checkout.
+        """
+        driver, pages = self._acquire()
+        try:
+            yield driver
+        except BaseException:
+            self._release(driver, pages, broken=True)
+            raise
+        else:
+            self._release(driver, pages)
+
+    def stats(self):
+        """Return a snapshot of pool utilisation."""
+        with self._condition:
+            elapsed = max(time.monotonic() - self._started_at, 1e-9)
+            return {
+                "size": self.size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "created": self.created,
+                "recycled": self.recycled,
+                "discarded": self.discarded,
+                "checkouts": self.checkouts,
+                "avg_wait_seconds": (
+                    self.wait_time / self.checkouts if self.checkouts else 0.0
+                ),
+                "utilisation": min(self.busy_time / (elapsed * self.size), 1.0),
+            }
+
+    def log_stats(self):
+        """Log the current pool utilisation."""
+        stats = self.stats()
+        log.info(
+            f"🚗 Driver pool: {stats['created']} started, {stats['checkouts']} checkouts, "
+            f"{stats['recycled']} recycled, {stats['discarded']} discarded, "
+            f"utilisation {stats['utilisation']:.0%}, "
+            f"avg wait {stats['avg_wait_seconds']:.2f}s"
+        )
+
+    def close(self):
+        """Quit all idle drivers; drivers in use are quit when returned."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for driver, _ in idle:
+            _quit_quietly(driver)
+
+
+def _quit_quietly(driver):
+    try:
+        driver.quit()
+    except Exception as e:
+        log.warning(f"⚠️ Failed to quit pooled browser: {e}")
@@ -2,9 +2,10 @@
 # IMPORTS
 # ===========================
 import os
+import atexit
 import logging
 from threading import Thread
-from flask import Flask, send_file, abort
+from flask import Flask, Response, jsonify, send_file, abort
 
 # Dash imports
 import dash
@@ -22,14 +23,16 @@ from app_layout import (
     inactive_card_style,
     modern_card_hover_effect,
 )
-from advanced_search import extract_report_results, download_reports
+from advanced_search import cached_extract_report_results, download_reports
 from scraper import (
     setup_driver,
-    login_with_selenium,
-    search_topic,
+    ensure_logged_in,
+    cached_search_topic,
     scrape_topic,
     get_files_to_be_downloaded,
     get_failed_downloads,
+    close_driver_pool,
+    telemetry,
 )
 from transform import (
     pipeline_transform,
@@ -47,6 +50,8 @@ from transform import (
     tr12_transform_to_probability,
 )
 from metrics import calculate_sheet_score
+from topic_matcher import MATCH_COLORS, TopicMatcher
+from logging_config import configure_logging
 
 # ===========================
 # GLOBAL VARIABLES
@@ -101,22 +106,6 @@ def populate_initial_files():
             initial_files.add(relative_path)
 
 
-def determine_match_type(input_topic, result_topic):
-    """Classify the match type based on topic similarity."""
-    input_topic_lower = input_topic.lower()
-    result_topic_lower = result_topic.lower()
-
-    if input_topic_lower == result_topic_lower:
-        return "Exact match"
-    elif (
-        input_topic_lower in result_topic_lower
-        or result_topic_lower in input_topic_lower
-    ):
-        return "Close match"
-    else:
-        return "Somewhat match"
-
-
 # ===========================
 # CUSTOM LOGGING HANDLER
 # ===========================
@@ -238,7 +227,7 @@ def login_action(n_clicks):
     driver = setup_driver()
 
     def login_task():
-        if login_with_selenium(driver):
+        if ensure_logged_in(driver):
             logging.info("Login successful.")
             return True
         else:
@@ -325,6 +314,8 @@ def update_files_to_download_display(files_to_be_downloaded):
         State("advanced-scraping-checkbox", "value"),
         State("strict-match-checkbox", "value"),
         State("max-results-input", "value"),
+        State("concurrency-input", "value"),
+        State("refresh-search-checkbox", "value"),
     ],
     prevent_initial_call=True,
 )
@@ -338,16 +329,24 @@ def handle_search_selection_scraping(
     checkbox_value,
     strict_match_checkbox,
     max_results_input,
+    concurrency_input,
+    refresh_search,
 ):
     global session_topics, selected_topic_url, selected_topic_name, driver, advanced_reports
     checkbox_enabled = "enabled" in checkbox_value if checkbox_value else False
 
     # Handle search
     if ctx.triggered_id == "search-button":
-        topics = search_topic(
-            driver, topic_input, strict_match_checkbox, max_results_input
+        topics = cached_search_topic(
+            driver,
+            topic_input,
+            strict_match_checkbox,
+            max_results_input,
+            refresh_search,
+        )
+        advanced_reports, advanced_matches = cached_extract_report_results(
+            driver, topic_input, refresh_search
         )
-        advanced_reports, advanced_matches = extract_report_results(driver, topic_input)
         session_topics = topics or []
 
         if not topics:
@@ -364,22 +363,14 @@ def handle_search_selection_scraping(
 
         logging.info(f"🎉 Found {len(topics)} topics for '{topic_input}'.")
 
-        # Sort topics by match priority
-        match_priority_map = {"Exact match": 1, "Close match": 2, "Somewhat match": 3}
-        temp_topics = [
-            (name, url, determine_match_type(topic_input, name)) for name, url in topics
-        ]
-        sorted_topics = sorted(temp_topics, key=lambda x: match_priority_map[x[2]])
-        session_topics = [(name, url) for (name, url, mtype) in sorted_topics]
+        # Rank topics by fuzzy similarity to the query and its demonym
+        sorted_topics = TopicMatcher(topic_input).rank(topics)
+        session_topics = [(name, url) for (name, url, _, _) in sorted_topics]
 
         # Create result cards
         result_cards = []
-        for idx, (name, url, match_type) in enumerate(sorted_topics):
-            match_color = {
-                "Exact match": "#28a745",
-                "Close match": "#ffc107",
-                "Somewhat match": "#dc3545",
-            }.get(match_type, "#6c757d")
+        for idx, (name, url, score, match_type) in enumerate(sorted_topics):
+            match_color = MATCH_COLORS.get(match_type, "#6c757d")
 
             result_cards.append(
                 dbc.Card(
@@ -398,7 +389,7 @@ def handle_search_selection_scraping(
                                             },
                                         ),
                                         html.Div(
-                                            match_type,
+                                            f"{match_type} ({score:.0f}%)",
                                             style={
                                                 "color": match_color,
                                                 "font-weight": "bold",
@@ -472,13 +463,16 @@ def handle_search_selection_scraping(
 
         # Put scraping in thread TODO: terminate thread by flag
 
-        thread = Thread(target=scrape_topic(selected_topic_url))
+        thread = Thread(
+            target=scrape_topic, args=(selected_topic_url, concurrency_input)
+        )
         thread.start()
         thread.join()
 
         if checkbox_enabled:
             logging.info("Triggering report download due to checkbox being enabled.")
-            download_reports(driver, advanced_reports, selected_topic_name)
+            # Reports are downloaded by a warm browser from the shared pool
+            download_reports(None, advanced_reports, selected_topic_name)
 
         return (
             dash.no_update,
@@ -692,6 +686,18 @@ def download_file(filepath):
         return abort(404, description="File not found.")
 
 
+@server.route("/metrics")
+def metrics():
+    """Download telemetry in the Prometheus text format."""
+    return Response(telemetry.prometheus(), mimetype="text/plain; version=0.0.4")
+
+
+@server.route("/metrics.json")
+def metrics_json():
+    """Download telemetry as a JSON run report."""
+    return jsonify(telemetry.report())
+
+
 # Update logs
 @app.callback(Output("log-window", "children"), Input("log-interval", "n_intervals"))
 def update_logs(n_intervals):
@@ -1367,4 +1373,7 @@ def handle_topic_selection(n_clicks):
 
 
 if __name__ == "__main__":
+    configure_logging()
+    # Quit the pooled headless browsers when the server stops
+    atexit.register(close_driver_pool)
     app.run_server(debug=True)
@@ -0,0 +1,38 @@
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+
+    PARSER = "lxml"  # C-based tree builder, several times faster than html.parser
+except ImportError:
+    PARSER = "html.parser"
+
+
+def has_class(name):
+    """
+    Match one CSS class inside a class attribute. Strainers see the raw
+    attribute while parsing, so a plain string would only match elements
+    whose class attribute is exactly `name`.
+    """
+    return re.compile(rf"(^|\s){re.escape(name)}(\s|$)")
+
+
+# Targeted parses: only the subtree a caller needs is turned into a tree
+STATISTIC_CHAPTERS = SoupStrainer("section", id="statisticChapter")
+REPORT_TEASER = SoupStrainer("a", class_=has_class("dossierTeaser__link"))
+SEARCH_RESULTS = SoupStrainer("a", class_=has_class("resultList__itemBox"))
+REPORT_RESULTS = SoupStrainer(class_=has_class("reportResult"))
+XLS_BUTTON_TRACK = re.compile("paywall_c2a--xls")  # Marks the XLS download button
+XLS_BUTTON = SoupStrainer(attrs={"data-paywall-info-box-track": XLS_BUTTON_TRACK})
+FORMS = SoupStrainer("form")
+
+
+def make_soup(html, parse_only=None, parser=None):
+    """
+    Parse HTML with the fastest available backend.
+    :param parse_only: Optional SoupStrainer limiting the parse to matching elements.
+    :param parser: Override the backend ("lxml" or "html.parser").
+    """
+    return BeautifulSoup(html, parser or PARSER, parse_only=parse_only)
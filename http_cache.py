@@ -0,0 +1,150 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+
+from http_client import Page, REQUEST_TIMEOUT
+
+log = logging.getLogger()
+
+CACHE_FOLDER = os.path.abspath(os.path.join(".cache", "http"))
+DEFAULT_TTL = 6 * 60 * 60  # Serve cached pages without revalidation for 6 hours
+MAX_CACHE_BYTES = 200 * 1024 * 1024  # Evict least recently used pages above 200 MB
+
+
+class HttpCache:
+    """
+    On-disk cache of page bodies keyed by URL, with TTL, ETag / Last-Modified
+    revalidation and size-bounded LRU eviction.
+    :param folder: Directory holding `<sha256>.json` metadata and `<sha256>.html` bodies.
+    :param ttl: Seconds an entry is served without contacting the server.
+    :param max_bytes: Total body size above which least recently used entries are evicted.
+    """
+
+    def __init__(self, folder=CACHE_FOLDER, ttl=DEFAULT_TTL, max_bytes=MAX_CACHE_BYTES):
+        self.folder = folder
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.folder, key)
+        return f"{base}.json", f"{base}.html"
+
+    def _load(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as file:
+                meta = json.load(file)
+            with open(body_path, "r", encoding="utf-8") as file:
+                body = file.read()
+        except (OSError, ValueError):
+            return None, None
+        if meta.get("url") != url:
+            return None, None
+        return meta, body
+
+    def _write(self, path, content):
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(temp_path, path)
+
+    def _store(self, url, meta, body=None):
+        os.makedirs(self.folder, exist_ok=True)
+        meta_path, body_path = self._paths(url)
+        if body is not None:
+            self._write(body_path, body)
+        else:
+            try:
+                os.utime(body_path)  # Mark as recently used
+            except FileNotFoundError:
+                return  # Evicted meanwhile; the next fetch is a plain miss
+        self._write(meta_path, json.dumps(meta))
+
+    def fetch(self, session, url, timeout=REQUEST_TIMEOUT):
+        """Return a Page for `url`, served from disk when fresh or unchanged."""
+        meta, body = self._load(url)
+        now = time.time()
+
+        if meta and now - meta["fetched_at"] < self.ttl:
+            try:
+                os.utime(self._paths(url)[1])  # Mark as recently used
+            except FileNotFoundError:
+                meta, body = None, None  # Evicted since it was read: a cache miss
+            else:
+                self.hits += 1
+                return Page(url, 200, body)
+
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and meta:
+            self.revalidated += 1
+            meta["fetched_at"] = now
+            self._store(url, meta)
+            return Page(url, 200, body)
+
+        self.misses += 1
+        if response.status_code == 200:
+            meta = {
+                "url": url,
+                "fetched_at": now,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+            self._store(url, meta, response.text)
+            self.evict()
+        return Page(url, response.status_code, response.text)
+
+    def invalidate(self, url):
+        """Drop a single URL from the cache."""
+        for path in self._paths(url):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits into max_bytes."""
+        with self._lock:
+            try:
+                bodies = [
+                    entry
+                    for entry in os.scandir(self.folder)
+                    if entry.name.endswith(".html")
+                ]
+            except FileNotFoundError:
+                return
+            sizes = {entry.path: entry.stat() for entry in bodies}
+            total = sum(stat.st_size for stat in sizes.values())
+            if total <= self.max_bytes:
+                return
+
+            for body_path in sorted(sizes, key=lambda path: sizes[path].st_mtime):
+                if total <= self.max_bytes:
+                    break
+                meta_path = f"{body_path[:-len('.html')]}.json"
+                for path in (body_path, meta_path):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                total -= sizes[body_path].st_size
+            log.info(f"🧹 HTTP cache trimmed to {total / 1024 / 1024:.1f} MB.")
+
+    def stats(self):
+        """Return hit / revalidation / miss counters."""
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+        }
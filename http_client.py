@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.adapters import HTTPAdapter
+
+from rate_limit import RateLimitedAdapter
+
+log = logging.getLogger()
+
+FETCH_CONCURRENCY = 8  # Pages fetched at the same time
+POOL_CONNECTIONS = 16  # Keep-alive connections kept open per host
+REQUEST_TIMEOUT = 20
+
+# Minimal response shape shared by every page fetch
+Page = namedtuple("Page", ["url", "status_code", "text"])
+
+
+def configure_session(session, pool_size=POOL_CONNECTIONS, limiter=None):
+    """Mount a connection-pooled adapter so concurrent fetches reuse keep-alive connections.
+    With a `limiter`, every request first takes a token from it."""
+    if limiter is not None:
+        adapter = RateLimitedAdapter(
+            limiter, pool_connections=pool_size, pool_maxsize=pool_size
+        )
+    else:
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def fetch_page(session, url, timeout=REQUEST_TIMEOUT, cache=None):
+    """Fetch a single page, optionally through an HttpCache.
+    Network errors are logged and reported as status None."""
+    try:
+        if cache is not None:
+            return cache.fetch(session, url, timeout)
+        response = session.get(url, timeout=timeout)
+        return Page(url, response.status_code, response.text)
+    except Exception as e:
+        log.warning(f"⚠️ Request to {url} failed: {e}")
+        return Page(url, None, "")
+
+
+async def fetch_page_async(
+    session, url, semaphore, timeout=REQUEST_TIMEOUT, cache=None
+):
+    """Fetch a page without blocking the event loop, bounded by `semaphore`."""
+    async with semaphore:
+        return await asyncio.to_thread(fetch_page, session, url, timeout, cache)
+
+
+async def fetch_pages_async(session, urls, concurrency=FETCH_CONCURRENCY, cache=None):
+    """Fetch many pages concurrently; results keep the order of `urls`."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    return await asyncio.gather(
+        *(fetch_page_async(session, url, semaphore, cache=cache) for url in urls)
+    )
+
+
+def run_sync(coroutine):
+    """Run a coroutine to completion from synchronous code, even inside a running loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def fetch_pages(session, urls, concurrency=FETCH_CONCURRENCY, cache=None):
+    """Synchronous wrapper around fetch_pages_async for existing callers."""
+    urls = list(urls)
+    if not urls:
+        return []
+    return run_sync(fetch_pages_async(session, urls, concurrency, cache))
@@ -0,0 +1,31 @@
+import logging
+import threading
+
+LOG_FILE = "scraper.log"
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_configured = False
+_lock = threading.Lock()
+
+
+def configure_logging(log_file=LOG_FILE, level=logging.INFO):
+    """
+    Log to the console and to `log_file` (truncated on the first call). Entry
+    points call this; importing a module never touches the root logger. Further
+    calls are no-ops, and handlers added by others (e.g. the GUI's) are kept.
+    """
+    global _configured
+    with _lock:
+        if _configured:
+            return
+        formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+        handlers = [logging.StreamHandler()]
+        if log_file:
+            handlers.append(logging.FileHandler(log_file, mode="w", encoding="utf-8"))
+        root = logging.getLogger()
+        for handler in handlers:
+            handler.setFormatter(formatter)
+            root.addHandler(handler)
+        root.setLevel(level)
+        _configured = True
@@ -0,0 +1,147 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+
+from sqlite_store import connect
+
+log = logging.getLogger()
+
+MANIFEST_NAME = "manifest.sqlite"
+LEGACY_MANIFEST_NAME = "manifest.json"  # Written by earlier versions, imported once
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+FIELDS = ("status", "file", "sha256", "size", "attempts", "error", "timestamp")
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS sections ("
+    " url TEXT PRIMARY KEY,"
+    " status TEXT NOT NULL,"
+    " file TEXT,"
+    " sha256 TEXT,"
+    " size INTEGER,"
+    " attempts INTEGER,"
+    " error TEXT,"
+    " timestamp TEXT NOT NULL)"
+)
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ScrapeManifest:
+    """
+    Per-topic record of every section download (status, file, hash, size, time),
+    stored in SQLite in the topic folder so interrupted scrapes can resume.
+    Every update writes one row instead of rewriting the whole manifest.
+    """
+
+    def __init__(self, topic_folder):
+        self.path = os.path.join(topic_folder, MANIFEST_NAME)
+        self._lock = threading.Lock()
+        with connect(self.path, SCHEMA) as connection:
+            self.entries = {
+                row[0]: {
+                    field: value
+                    for field, value in zip(FIELDS, row[1:])
+                    if value is not None
+                }
+                for row in connection.execute(
+                    f"SELECT url, {', '.join(FIELDS)} FROM sections"
+                )
+            }
+        legacy_path = os.path.join(topic_folder, LEGACY_MANIFEST_NAME)
+        if not self.entries and os.path.exists(legacy_path):
+            self._import_legacy(legacy_path)
+
+    def _import_legacy(self, legacy_path):
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as file:
+                entries = json.load(file).get("sections", {})
+        except (OSError, ValueError) as e:
+            log.warning(f"⚠️ Ignoring unreadable manifest {legacy_path}: {e}")
+            return
+        with connect(self.path, SCHEMA) as connection:
+            for url, entry in entries.items():
+                self._write(connection, url, entry)
+        self.entries = entries
+        os.remove(legacy_path)
+
+    def is_complete(self, url, file_path):
+        """Return True if the section was downloaded and its file is still intact."""
+        entry = self.entries.get(url)
+        return (
+            entry is not None
+            and entry["status"] == STATUS_DONE
+            and os.path.exists(file_path)
+            and os.path.getsize(file_path) == entry["size"]
+        )
+
+    def pending(self, urls, path_for):
+        """
+        Return the URLs that still need to be downloaded, keeping their order.
+        Files saved by runs that predate the manifest are adopted as done.
+        """
+        remaining = []
+        for url in urls:
+            file_path = path_for(url)
+            if url not in self.entries and os.path.isfile(file_path):
+                if os.path.getsize(file_path) > 0:
+                    self.mark_done(url, file_path)
+            if not self.is_complete(url, file_path):
+                remaining.append(url)
+        return remaining
+
+    def mark_done(self, url, file_path, digest=None):
+        """
+        :param digest: SHA-256 of the file if the caller already knows it
+            (e.g. from BlobStore.add); otherwise the file is hashed here.
+        """
+        self._update(
+            url,
+            {
+                "status": STATUS_DONE,
+                "file": os.path.basename(file_path),
+                "sha256": digest or file_sha256(file_path),
+                "size": os.path.getsize(file_path),
+            },
+        )
+
+    def mark_failed(self, url, error=None):
+        previous = self.entries.get(url, {})
+        self._update(
+            url,
+            {
+                "status": STATUS_FAILED,
+                "attempts": previous.get("attempts", 0) + 1,
+                "error": str(error) if error else None,
+            },
+        )
+
+    def _update(self, url, entry):
+        entry["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        with connect(self.path, SCHEMA) as connection:
+            self._write(connection, url, entry)
+        with self._lock:
+            self.entries[url] = entry
+
+    @staticmethod
+    def _write(connection, url, entry):
+        connection.execute(
+            f"INSERT OR REPLACE INTO sections VALUES (?{', ?' * len(FIELDS)})",
+            (url, *(entry.get(field) for field in FIELDS)),
+        )
+
+    def summary(self):
+        """Return the number of sections per status."""
+        counts = {}
+        for entry in self.entries.values():
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return counts
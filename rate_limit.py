@@ -0,0 +1,119 @@
+import os
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+
+from requests.adapters import HTTPAdapter
+
+try:
+    import fcntl
+except ImportError:  # Windows: cross-process limiting is not available
+    fcntl = None
+
+log = logging.getLogger()
+
+DEFAULT_RATE = 2.0  # Requests per second allowed on average
+DEFAULT_BURST = 4  # Requests that may be sent back to back
+MIN_RATE = 0.2  # Never slow down below one request every five seconds
+SLOWDOWN_FACTOR = 0.5  # Rate multiplier after a 429 / 5xx answer
+RECOVERY_FACTOR = 1.05  # Rate multiplier after a successful answer
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by every worker thread. With `state_file`
+    the bucket lives in a file guarded by an exclusive lock, so several
+    processes share one budget. The rate adapts to server feedback: it is
+    halved on HTTP 429 / 5xx and slowly restored on success.
+    """
+
+    def __init__(
+        self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, state_file=None, min_rate=MIN_RATE
+    ):
+        self.max_rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.state_file = state_file if fcntl is not None else None
+        if state_file and fcntl is None:
+            log.warning("⚠️ File-based rate limiting is not supported here.")
+        self._lock = threading.Lock()
+        self._state = {"tokens": burst, "updated": time.time(), "rate": rate}
+        self.waited = 0.0
+
+    @contextmanager
+    def _locked_state(self):
+        """Yield the mutable bucket state under the thread (and file) lock."""
+        with self._lock:
+            if self.state_file is None:
+                yield self._state
+                return
+
+            os.makedirs(os.path.dirname(self.state_file) or ".", exist_ok=True)
+            with open(self.state_file, "a+", encoding="utf-8") as file:
+                fcntl.flock(file, fcntl.LOCK_EX)
+                try:
+                    file.seek(0)
+                    try:
+                        state = json.loads(file.read())
+                    except ValueError:
+                        state = dict(self._state)
+                    yield state
+                    file.seek(0)
+                    file.truncate()
+                    file.write(json.dumps(state))
+                    file.flush()
+                finally:
+                    fcntl.flock(file, fcntl.LOCK_UN)
+
+    @property
+    def rate(self):
+        with self._locked_state() as state:
+            return state["rate"]
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._locked_state() as state:
+                now = time.time()
+                elapsed = max(0.0, now - state["updated"])
+                state["tokens"] = min(
+                    self.burst, state["tokens"] + elapsed * state["rate"]
+                )
+                state["updated"] = now
+                if state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    return
+                wait = (1 - state["tokens"]) / state["rate"]
+            self.waited += wait
+            time.sleep(wait)
+
+    def observe(self, status_code):
+        """Adapt the rate to the server's answer."""
+        with self._locked_state() as state:
+            if status_code == 429 or status_code >= 500:
+                state["rate"] = max(self.min_rate, state["rate"] * SLOWDOWN_FACTOR)
+                state["tokens"] = 0
+                slowed_to = state["rate"]
+            else:
+                state["rate"] = min(self.max_rate, state["rate"] * RECOVERY_FACTOR)
+                slowed_to = None
+        if slowed_to is not None:
+            log.warning(
+                f"🐢 Server answered {status_code}, slowing down to {slowed_to:.2f} req/s."
+            )
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a token before every request and reports the status back."""
+
+    def __init__(self, limiter, *args, **kwargs):
+        self.limiter = limiter
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.acquire()
+        response = super().send(request, **kwargs)
+        self.limiter.observe(response.status_code)
+        return response
@@ -0,0 +1,173 @@
+import os
+import re
+import time
+import logging
+
+from sqlite_store import connect
+
+log = logging.getLogger()
+
+CATALOGUE_DB = os.path.abspath(os.path.join(".cache", "report_catalogue.sqlite"))
+DEFAULT_TTL = 24 * 60 * 60  # Re-crawl a query's listing once a day
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS reports ("
+    " url TEXT PRIMARY KEY,"
+    " title TEXT NOT NULL,"
+    " published_in TEXT,"
+    " first_seen REAL NOT NULL,"
+    " last_seen REAL NOT NULL);"
+    "CREATE TABLE IF NOT EXISTS report_topics ("
+    " url TEXT NOT NULL,"
+    " topic TEXT NOT NULL,"
+    " PRIMARY KEY (url, topic));"
+    "CREATE TABLE IF NOT EXISTS listings ("
+    " query TEXT NOT NULL,"
+    " url TEXT NOT NULL,"
+    " position INTEGER NOT NULL,"
+    " seen_at REAL NOT NULL,"
+    " PRIMARY KEY (query, url));"
+    "CREATE TABLE IF NOT EXISTS listing_crawls ("
+    " query TEXT PRIMARY KEY,"
+    " crawled_at REAL NOT NULL);"
+    "CREATE VIRTUAL TABLE IF NOT EXISTS report_index USING fts5("
+    " url UNINDEXED, title, topics,"
+    " tokenize = 'unicode61 remove_diacritics 2');"
+)
+
+
+def fts_query(text):
+    """Turn free text into an FTS5 query matching all of its words."""
+    words = re.findall(r"\w+", (text or "").lower())
+    return " ".join(f'"{word}"' for word in words)
+
+
+class ReportCatalogue:
+    """
+    Local SQLite catalogue of Statista reports (title, URL, publication date
+    and the topics they were found under) with an FTS5 index over titles and
+    topics. Crawled listings are added incrementally; a query crawled within
+    the TTL is answered locally with the listing crawled for it.
+    """
+
+    def __init__(self, path=CATALOGUE_DB, ttl=DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+
+    def _connect(self):
+        return connect(self.path, SCHEMA)
+
+    @staticmethod
+    def _query_key(query):
+        return (query or "").strip().lower()
+
+    def add(self, reports, topic=None, listed=True):
+        """
+        Insert or update reports and tag them with the topic they were found under.
+        :param listed: The reports are a page of the topic's default listing, in
+            listing order, and are remembered as part of that listing.
+        """
+        now = time.time()
+        topic = self._query_key(topic)
+        with self._connect() as connection:
+            position = connection.execute(
+                "SELECT COALESCE(MAX(position), 0) FROM listings"
+            ).fetchone()[0]
+            for report in reports:
+                url = report["url"]
+                connection.execute(
+                    "INSERT INTO reports VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT(url) DO UPDATE SET title = excluded.title,"
+                    " published_in = excluded.published_in,"
+                    " last_seen = excluded.last_seen",
+                    (url, report["title"], report.get("published_in"), now, now),
+                )
+                if listed:
+                    position += 1
+                    connection.execute(
+                        "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?)",
+                        (topic, url, position, now),
+                    )
+                if topic:
+                    connection.execute(
+                        "INSERT OR IGNORE INTO report_topics VALUES (?, ?)",
+                        (url, topic),
+                    )
+                topics = " ".join(
+                    row[0]
+                    for row in connection.execute(
+                        "SELECT topic FROM report_topics WHERE url = ?", (url,)
+                    )
+                )
+                connection.execute("DELETE FROM report_index WHERE url = ?", (url,))
+                connection.execute(
+                    "INSERT INTO report_index VALUES (?, ?, ?)",
+                    (url, report["title"], topics),
+                )
+
+    def mark_crawled(self, query, started=None):
+        """
+        Remember that the live listing for `query` was just crawled completely.
+        :param started: time.time() the crawl began; listing entries not seen
+            since then have dropped out of the listing.
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO listing_crawls VALUES (?, ?)",
+                (self._query_key(query), time.time() if started is None else started),
+            )
+
+    def is_fresh(self, query):
+        """True if the listing for `query` was crawled within the TTL."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT crawled_at FROM listing_crawls WHERE query = ?",
+                (self._query_key(query),),
+            ).fetchone()
+        return row is not None and time.time() - row[0] <= self.ttl
+
+    def listing(self, query):
+        """Return the reports of the last complete crawl of `query`, in listing order."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT r.title, r.url, r.published_in FROM listings l"
+                " JOIN listing_crawls c ON c.query = l.query"
+                " JOIN reports r ON r.url = l.url"
+                " WHERE l.query = ? AND l.seen_at >= c.crawled_at"
+                " ORDER BY l.position",
+                (self._query_key(query),),
+            )
+            return [
+                {"title": title, "url": url, "published_in": published_in}
+                for title, url, published_in in rows
+            ]
+
+    def search(self, query=None, limit=None):
+        """
+        Free-text lookup: return catalogue reports matching every word of
+        `query` in their title or topics, best match first; without a query,
+        every report. Use listing() for what the site lists for a query.
+        """
+        match = fts_query(query)
+        with self._connect() as connection:
+            if match:
+                rows = connection.execute(
+                    "SELECT r.title, r.url, r.published_in FROM report_index"
+                    " JOIN reports r USING (url)"
+                    " WHERE report_index MATCH ? ORDER BY bm25(report_index)"
+                    " LIMIT ?",
+                    (match, limit or -1),
+                )
+            else:
+                rows = connection.execute(
+                    "SELECT title, url, published_in FROM reports"
+                    " ORDER BY first_seen LIMIT ?",
+                    (limit or -1,),
+                )
+            return [
+                {"title": title, "url": url, "published_in": published_in}
+                for title, url, published_in in rows
+            ]
+
+    def count(self):
+        with self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
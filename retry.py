@@ -0,0 +1,136 @@
+import time
+import random
+import logging
+import threading
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
+
+log = logging.getLogger()
+
+# Failure classes
+TIMEOUT = "timeout"
+NO_ACCESS = "no_access"
+SESSION_EXPIRED = "session_expired"
+MISSING_BUTTON = "missing_button"
+UNKNOWN = "unknown"
+
+# How many attempts each failure class is worth; 1 means "do not retry"
+DEFAULT_ATTEMPTS = {
+    TIMEOUT: 3,
+    UNKNOWN: 3,
+    MISSING_BUTTON: 2,
+    SESSION_EXPIRED: 1,  # Retrying with the same cookies cannot succeed
+    NO_ACCESS: 1,
+}
+
+
+class DownloadError(Exception):
+    """A download failure together with its failure class."""
+
+    def __init__(self, kind, message=""):
+        super().__init__(message or kind)
+        self.kind = kind
+
+
+def classify_failure(error):
+    """Map an exception to one of the failure classes."""
+    if isinstance(error, DownloadError):
+        return error.kind
+    if isinstance(error, (TimeoutException, TimeoutError)):
+        return TIMEOUT
+    if isinstance(error, NoSuchElementException):
+        return MISSING_BUTTON
+    if isinstance(error, WebDriverException) and "timeout" in str(error).lower():
+        return TIMEOUT
+    return UNKNOWN
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter and a per-failure-class attempt budget.
+    :param attempts: Mapping of failure class to the maximum number of attempts.
+    :param base_delay: Delay before the first retry, in seconds.
+    :param max_delay: Upper bound for a single delay, in seconds.
+    :param jitter: Relative random spread applied to every delay (0.5 = ±50 %).
+    """
+
+    def __init__(self, attempts=None, base_delay=2.0, max_delay=30.0, jitter=0.5):
+        self.attempts = dict(DEFAULT_ATTEMPTS, **(attempts or {}))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def should_retry(self, kind, attempt):
+        return attempt < self.attempts.get(kind, 1)
+
+    def delay(self, attempt):
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class FailureStats:
+    """Thread-safe per-run counters of retries and final failures by class."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.failures = {}  # url -> failure class
+        self.retries = {}  # failure class -> retries spent
+
+    def record_retry(self, kind):
+        with self._lock:
+            self.retries[kind] = self.retries.get(kind, 0) + 1
+
+    def record_failure(self, url, kind):
+        with self._lock:
+            self.failures[url] = kind
+
+    @property
+    def failed_count(self):
+        return len(self.failures)
+
+    @property
+    def failed_urls(self):
+        return list(self.failures)
+
+    def summary(self):
+        """Return final failures and retries grouped by failure class."""
+        with self._lock:
+            by_kind = {}
+            for kind in self.failures.values():
+                by_kind[kind] = by_kind.get(kind, 0) + 1
+            return {
+                "failed": len(self.failures),
+                "failed_by_kind": by_kind,
+                "retries_by_kind": dict(self.retries),
+            }
+
+
+def run_with_retry(operation, policy, stats=None, label=""):
+    """
+    Call `operation()` until it succeeds or its failure class runs out of attempts.
+    :raises DownloadError: With the failure class of the last error.
+    """
+    attempt = 1
+    while True:
+        try:
+            return operation()
+        except Exception as e:
+            kind = classify_failure(e)
+            if not policy.should_retry(kind, attempt):
+                if isinstance(e, DownloadError):
+                    raise
+                raise DownloadError(kind, str(e)) from e
+
+            delay = policy.delay(attempt)
+            if stats is not None:
+                stats.record_retry(kind)
+            log.info(
+                f"🔄 Retrying {label} after {kind} "
+                f"({attempt + 1}/{policy.attempts[kind]}) in {delay:.1f}s..."
+            )
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,74 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from tqdm import tqdm
+
+log = logging.getLogger()
+
+DEFAULT_CONCURRENCY = 2  # Number of downloads running at the same time
+MAX_CONCURRENCY = 8  # Upper bound accepted from the CLI / GUI
+
+
+def clamp_concurrency(value):
+    """Coerce a user-supplied concurrency level into [1, MAX_CONCURRENCY]."""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_CONCURRENCY
+    return max(1, min(value, MAX_CONCURRENCY))
+
+
+class ProgressCounter:
+    """Thread-safe success / failure counters that do not depend on completion order."""
+
+    def __init__(self, total, pbar=None):
+        self.total = total
+        self.succeeded = 0
+        self.failed = 0
+        self.pbar = pbar
+        self._lock = threading.Lock()
+
+    @property
+    def processed(self):
+        return self.succeeded + self.failed
+
+    def record(self, success):
+        with self._lock:
+            if success:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+            if self.pbar is not None:
+                self.pbar.update(1)
+                self.pbar.set_postfix(ok=self.succeeded, failed=self.failed)
+
+
+def run_concurrently(task, items, concurrency=DEFAULT_CONCURRENCY, desc=None):
+    """
+    Run task(item) for every item with at most `concurrency` tasks in flight.
+    A task counts as successful unless it returns False or raises.
+    :return: ProgressCounter with the final counts.
+    """
+    items = list(items)
+    concurrency = clamp_concurrency(concurrency)
+
+    with tqdm(total=len(items), desc=desc, unit="file") as pbar:
+        progress = ProgressCounter(len(items), pbar)
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="download"
+        ) as executor:
+            futures = {executor.submit(task, item): item for item in items}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    log.error(f"❌ Task failed for {futures[future]}: {e}")
+                    result = False
+                progress.record(result is not False)
+
+    log.info(
+        f"📊 {progress.succeeded} succeeded, {progress.failed} failed "
+        f"out of {progress.total} ({concurrency} concurrent)."
+    )
+    return progress
@@ -2,14 +2,14 @@ import os
 import time
 import sys
 import io
-import glob
 import shutil
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import argparse
 from dotenv import load_dotenv
 from urllib.parse import urljoin
 import requests
-from bs4 import BeautifulSoup
-from tqdm import tqdm
 
 # Selenium imports
 from selenium import webdriver
@@ -18,35 +18,100 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
 
 # ChromeDriver auto-installer
 import chromedriver_autoinstaller
 
-# search for demonyms
-from denonyms import get_demonym
+# Console and file logging, set up by entry points
+from logging_config import configure_logging
+
+# Demonym-aware topic matching
+from topic_matcher import TopicMatcher
+
+# Warm, reusable browsers for downloads
+from driver_pool import DriverPool
+
+# Lean Chrome profile and navigation timing
+from browser_profile import PageLoadStats, apply_lean_options, block_urls
+
+# Process-wide (optionally cross-process) request rate limiting
+from rate_limit import DEFAULT_BURST, DEFAULT_RATE, TokenBucket
+
+# Connection-pooled, concurrent page fetching
+from http_client import FETCH_CONCURRENCY, configure_session, fetch_page, fetch_pages
+
+# On-disk cache for topic pages
+from http_cache import HttpCache
+
+# Encrypted cookie store to skip repeated logins
+from session_store import restore_session, save_session
+
+# Resumable per-topic download manifest
+from manifest import ScrapeManifest
+
+# Deduplicated, content-addressed storage of downloaded files
+from blob_store import BlobStore
+
+# Persistent search result cache shared by the CLI and the GUI
+from search_cache import SearchCache
+
+# Fast, targeted HTML parsing
+from html_parser import REPORT_TEASER, SEARCH_RESULTS, STATISTIC_CHAPTERS, make_soup
+
+# Browserless XLSX downloads over the shared HTTP session
+from direct_download import DirectLinkSwitch, download_xlsx_direct
+
+# Backoff, failure classification and per-run failure statistics
+from retry import (
+    NO_ACCESS,
+    TIMEOUT,
+    SESSION_EXPIRED,
+    MISSING_BUTTON,
+    DownloadError,
+    FailureStats,
+    RetryPolicy,
+    run_with_retry,
+)
+
+# Per-download folders and completion detection
+from downloads import isolated_download_dir, wait_for_download
+
+# Per-download timings, histograms and the Prometheus export
+from telemetry import DownloadTelemetry
+
+# Bounded-concurrency download scheduling
+from scheduler import DEFAULT_CONCURRENCY, clamp_concurrency, run_concurrently
 
 # URL for advanced scraping option
 xlsx_report_page = "https://www.statista.com/studies-and-reports/all-reports?idCountry=0&idBranch=0&idLanguage=0&reportType=0&documentTypes%5B%5D=xls&sortMethod=idRelevance&p=1"
 
 # Constants and global variables
 files_to_be_downloaded = 0  # Counter for files to download
-failed_downloads = []  # List of failed download URLs
-MAX_RETRIES = 2  # Retry limit for failed downloads
-failed = 0
-
-# Logging Configuration
-for handler in logging.root.handlers[:]:
-    logging.root.removeHandler(handler)  # Remove existing handlers
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[
-        logging.StreamHandler(),  # Console logging
-        logging.FileHandler("scraper.log", mode="w", encoding="utf-8"),  # File logging
-    ],
+DOWNLOAD_RETRY_POLICY = RetryPolicy()  # Backoff and attempts per failure class
+failure_stats = FailureStats()  # Failures of the current scrape run
+# The box shown instead of downloads without access; a whole class name, since
+# many elements of every statistic page (the XLS button too) mention "paywall"
+PAYWALL_SELECTOR = "[class~='paywall']"
+XLS_BUTTON_XPATH = (
+    "//button[contains(@data-paywall-info-box-track, 'paywall_c2a--xls')]"
 )
+POOL_SIZE = 2  # Number of warm browsers kept for downloads
+POOL_MAX_PAGES = 50  # Recycle a pooled browser after this many downloads
+DIRECT_DOWNLOADS = True  # Try plain HTTP before falling back to Selenium
+direct_links = DirectLinkSwitch()  # Turns the HTTP path off when pages have no link
+SEARCH_PAGE_BATCH = 4  # Search result pages fetched concurrently
+REPORT_WORKERS = 2  # Report PDFs downloaded in the background at the same time
+driver_pool = None  # Created lazily by get_driver_pool()
+# Skip images, media and trackers in the browser; STATISTA_LEAN_BROWSER=0 disables it
+LEAN_BROWSER = os.getenv("STATISTA_LEAN_BROWSER", "1") != "0"
+page_load_stats = PageLoadStats()  # Time spent in browser navigations
+telemetry = DownloadTelemetry()  # Per-download timings, served by the GUI at /metrics
+TELEMETRY_REPORT = "download_telemetry.json"  # Written at the end of a CLI run
+
+_initialised = False  # Set by initialise() on first use
+_init_lock = threading.Lock()
+
 log = logging.getLogger()
 
 # Load environment variables
@@ -60,39 +125,138 @@ TOPICS_URL = "https://www.statista.com/topics/"
 SEARCH_URL = "https://www.statista.com/search/"
 DEST_FOLDER = os.path.abspath("statista_data")
 
-# Ensure destination folder exists
-os.makedirs(DEST_FOLDER, exist_ok=True)
-
-# Ensure ChromeDriver is installed
-chromedriver_autoinstaller.install()
+# One rate limit for every HTTP request and browser navigation; set
+# STATISTA_RATE_LIMIT_FILE to share it between processes
+limiter = TokenBucket(
+    float(os.getenv("STATISTA_RATE_LIMIT", DEFAULT_RATE)),
+    DEFAULT_BURST,
+    state_file=os.getenv("STATISTA_RATE_LIMIT_FILE"),
+)
 
 # Initialize a session for HTTP requests
-session = requests.Session()
+session = configure_session(requests.Session(), limiter=limiter)
+
+# Topic pages are fetched on selection and again on scraping; cache them on disk
+topic_page_cache = HttpCache()
+
+# Repeated searches for the same query and options are answered from disk
+search_cache = SearchCache()
+
+# Statistics shared by several topics are stored once and hardlinked into each
+blob_store = BlobStore()
+
+# Report PDFs are downloaded off the critical path of a topic; threads start on demand
+report_executor = ThreadPoolExecutor(
+    max_workers=REPORT_WORKERS, thread_name_prefix="report"
+)
+
+
+def initialise():
+    """Create the destination folder and install ChromeDriver, once per process.
+    Called on first use instead of at import, so importing the module is cheap."""
+    global _initialised
+    with _init_lock:
+        if _initialised:
+            return
+        os.makedirs(DEST_FOLDER, exist_ok=True)
+        chromedriver_autoinstaller.install()
+        _initialised = True
 
 
-def setup_driver():
-    """Configure and return a headless Selenium WebDriver."""
+def setup_driver(lean=None):
+    """Configure and return a headless Selenium WebDriver.
+    :param lean: Use the lean browser profile (defaults to LEAN_BROWSER)."""
+    initialise()
+    lean = LEAN_BROWSER if lean is None else lean
     options = Options()
     options.add_argument("--headless=new")  # Run Chrome in headless mode
     options.add_argument("--disable-gpu")  # Disable GPU acceleration
     options.add_argument(
         "--window-size=1920,1080"
     )  # Set window size to ensure elements are in view
-    options.add_experimental_option(
-        "prefs",
-        {
-            "download.default_directory": DEST_FOLDER,
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-        },
-    )
-    return webdriver.Chrome(options=options)
+    prefs = {
+        "download.default_directory": DEST_FOLDER,
+        "download.prompt_for_download": False,
+        "download.directory_upgrade": True,
+    }
+    if lean:
+        apply_lean_options(options, prefs)
+    options.add_experimental_option("prefs", prefs)
+    driver = webdriver.Chrome(options=options)
+    if lean:
+        block_urls(driver)
+    return driver
+
+
+def navigate(driver, url):
+    """Open a URL in a Selenium driver, respecting the shared rate limit.
+    Returns the page load time in seconds."""
+    limiter.acquire()
+    start = time.perf_counter()
+    driver.get(url)
+    elapsed = time.perf_counter() - start
+    page_load_stats.record(elapsed)
+    return elapsed
+
+
+def transfer_session_cookies(driver):
+    """Copy the cookies of the shared HTTP session into a Selenium driver."""
+    navigate(driver, "https://www.statista.com/")  # Set domain for cookies
+    for cookie in session.cookies:
+        cookie_dict = {
+            "name": cookie.name,
+            "value": cookie.value,
+            # Force the domain to match exactly the site you have open
+            "domain": "www.statista.com",
+            "path": "/",
+        }
+        driver.add_cookie(cookie_dict)
+    time.sleep(3)
+    limiter.acquire()
+    driver.refresh()  # Refresh to ensure cookies are applied
+
+
+def setup_authenticated_driver():
+    """Return a headless driver carrying the cookies of the logged-in session."""
+    driver = setup_driver()
+    try:
+        transfer_session_cookies(driver)
+    except Exception:
+        driver.quit()
+        raise
+    return driver
+
+
+def get_driver_pool(size=None):
+    """Return the shared pool of authenticated drivers, creating it on first use.
+    The pool is grown to hold at least `size` drivers; it never shrinks here, so
+    topics scraped side by side do not take browsers away from each other."""
+    global driver_pool
+    if driver_pool is None:
+        driver_pool = DriverPool(
+            setup_authenticated_driver,
+            size=size or POOL_SIZE,
+            max_pages=POOL_MAX_PAGES,
+        )
+    elif size and size > driver_pool.size:
+        driver_pool.resize(size)
+    return driver_pool
+
+
+def close_driver_pool():
+    """Log utilisation and quit all pooled drivers."""
+    global driver_pool
+    page_load_stats.log_summary()
+    if driver_pool is not None:
+        driver_pool.log_stats()
+        driver_pool.close()
+        driver_pool = None
 
 
 def login_with_selenium(driver):
     """Perform the login process using Selenium."""
     log.info("🔄 Starting Selenium login process...")
-    driver.get(LOGIN_URL)
+    navigate(driver, LOGIN_URL)
 
     # Step 1: Accept cookies
     try:
@@ -160,6 +324,7 @@ def login_with_selenium(driver):
         cookies = driver.get_cookies()
         for cookie in cookies:
             session.cookies.set(cookie["name"], cookie["value"])
+        save_session(cookies)
         return True
     except Exception as e:
         log.error(f"❌ Login confirmation failed: {e}")
@@ -167,87 +332,168 @@ def login_with_selenium(driver):
         return False
 
 
-def search_topic(driver, topic, strict_match=True, max_results=100):
-    """Search and return a list of URLs for topics that match
-    the user's query (country name or its demonym)."""
-    log.info(f'🔍 1/2 Searching for topics related to: "{topic}"...')
-
-    # # Get the demonym for the input topic
-    demonym = get_demonym(topic)
-    # # Pre-lowercase them for easy matching
-    topic_lower = topic.lower()
-    demonym_lower = demonym.lower() if demonym else None
+def ensure_logged_in(driver):
+    """Reuse a stored session if it is still valid, otherwise run the full login."""
+    if restore_session(session):
+        try:
+            transfer_session_cookies(driver)
+            return True
+        except Exception as e:
+            log.warning(f"⚠️ Could not apply stored session to the browser: {e}")
+    return login_with_selenium(driver)
+
+
+def search_page_url(query_topic, page_number):
+    """Return the URL of one page of topic search results."""
+    return f"{SEARCH_URL}?q={query_topic}&Search=&p={page_number}&tabGroup=topic"
+
+
+def parse_search_results(html):
+    """Return (topic name, topic URL) for every result box on a search page."""
+    soup = make_soup(html, SEARCH_RESULTS)
+    results = []
+    for box in soup.find_all("a", class_="resultList__itemBox"):
+        href = box.get("href", "").strip()
+        title_element = box.find("div", class_="itemContent__text")
+        topic_name = title_element.get_text(strip=True) if title_element else ""
+        results.append((topic_name, urljoin(TOPICS_URL, href)))
+    return results
+
+
+def browser_search_results(driver, url):
+    """Load a search page in the browser and parse its results."""
+    log.info(f"   Checking page in browser: {url}")
+    navigate(driver, url)
+
+    # Wait for the results to load if needed
+    driver.implicitly_wait(1)
+    return parse_search_results(driver.page_source)
+
+
+def iter_search_result_pages(driver, query_topic):
+    """
+    Yield the results of consecutive search pages until an empty page.
+    Pages are fetched over HTTP, SEARCH_PAGE_BATCH at a time; the browser is only
+    used when a request fails or when results are not present in the raw HTML.
+    """
+    first_url = search_page_url(query_topic, 1)
+    log.info(f"   Checking page: {first_url}")
+    page = fetch_page(session, first_url)
+    results = parse_search_results(page.text) if page.status_code == 200 else []
+
+    if not results:
+        # Results may be rendered by JavaScript: fall back to the browser
+        if driver is None:
+            return
+        page_number = 1
+        results = browser_search_results(driver, first_url)
+        while results:
+            yield results
+            page_number += 1
+            results = browser_search_results(
+                driver, search_page_url(query_topic, page_number)
+            )
+        return
 
-    page_number = 1
-    matches = []
-    query_topic = topic.replace(" ", "+")
+    yield results
+    page_number = 2
     while True:
+        urls = [
+            search_page_url(query_topic, number)
+            for number in range(page_number, page_number + SEARCH_PAGE_BATCH)
+        ]
+        log.info(f"   Checking pages {page_number}-{page_number + len(urls) - 1}")
+        for page in fetch_pages(session, urls, SEARCH_PAGE_BATCH):
+            results = (
+                parse_search_results(page.text) if page.status_code == 200 else None
+            )
+            if results is None and driver is not None:
+                results = browser_search_results(driver, page.url)
+            if not results:
+                return
+            yield results
+        page_number += SEARCH_PAGE_BATCH
 
-        url = f"{SEARCH_URL}?q={query_topic}&Search=&p={page_number}&tabGroup=topic"
-        log.info(f"   Checking page: {url}")
-        # response = session.get(url)
-        driver.get(url)
-
-        # Wait for the results to load if needed
-        driver.implicitly_wait(1)
-
-        html = driver.page_source
-        soup = BeautifulSoup(html, "html.parser")
-
-        # soup = BeautifulSoup(response.text, "html.parser")
-        topic_boxes = soup.find_all("a", class_="resultList__itemBox")
 
-        # Stop if no topics are found on this page
-        if not topic_boxes:
-            log.info(f" {len(topic_boxes)}  ⚠️ Reached the end of pagination.")
-            break
+def iter_search_topic(driver, topic, strict_match=True, max_results=100):
+    """Yield (topic name, topic URL) matches for the user's query as result pages arrive,
+    stopping as soon as max_results matches were found."""
+    log.info(f'🔍 1/2 Searching for topics related to: "{topic}"...')
 
-        for box in topic_boxes:
-            href = box.get("href", "").strip()
-            title_element = box.find("div", class_="itemContent__text")
-            topic_name = title_element.get_text(strip=True) if title_element else ""
-            topic_name_lower = topic_name.lower()
+    # Matches the query and its demonym (e.g. "France" and "French")
+    matcher = TopicMatcher(topic)
 
+    found = 0
+    query_topic = topic.replace(" ", "+")
+    for results in iter_search_result_pages(driver, query_topic):
+        for topic_name, topic_url in results:
             # Check if the user input OR its demonym is in the topic name
-            if strict_match:
-                topic_words = topic_lower.split()
-                word_match = any(word in topic_name_lower for word in topic_words)
-            else:
-                word_match = True
+            word_match = matcher.is_relevant(topic_name) if strict_match else True
 
             if word_match:
-                matches.append((topic_name, urljoin(TOPICS_URL, href)))
+                yield topic_name, topic_url
+                found += 1
 
             # Exit function
-            if len(matches) > max_results:
-                return matches
+            if found >= max_results:
+                return
+
+    log.info("⚠️ Reached the end of pagination.")
 
-        page_number += 1
+
+def search_topic(driver, topic, strict_match=True, max_results=100):
+    """Search and return a list of URLs for topics that match
+    the user's query (country name or its demonym)."""
+    matches = list(iter_search_topic(driver, topic, strict_match, max_results))
 
     if not matches:
         log.warning("⚠️ No topics found.")
         return []
 
-    # Log and return matches
-    # log.info("\nFound the following topics:")
-    # for i, (name, _) in enumerate(matches, 1):
-    #     log.info(f"[{i}] {name}")
-    # log.info(f"[{len(matches) + 1}] Select all")
     return matches
 
 
-def scrape_topic(topic_url):
-    """Scrape data from the topic page, save chapters and sections, download report, and XLSX files."""
-    global files_to_be_downloaded, failed_downloads
+def cached_search_topic(
+    driver, topic, strict_match=True, max_results=100, refresh=False
+):
+    """search_topic backed by the persistent search cache.
+    :param refresh: Search the live site even if a cached result exists."""
+    key = SearchCache.make_key(
+        topic, strict_match=bool(strict_match), max_results=max_results
+    )
+    matches = search_cache.cached(
+        "topics",
+        key,
+        lambda: search_topic(driver, topic, strict_match, max_results),
+        refresh,
+    )
+    return [tuple(match) for match in matches]
+
+
+def scrape_topic(topic_url, concurrency=DEFAULT_CONCURRENCY):
+    """Scrape data from the topic page, save chapters and sections, download report, and XLSX files.
+    :param concurrency: Number of XLSX downloads running at the same time.
+    :return: Summary dict of the run (status, section counts, failures).
+    """
+    global files_to_be_downloaded, failure_stats
+
+    initialise()
+    concurrency = clamp_concurrency(concurrency)
+    # Failures of this run; also published for get_failed_downloads()
+    stats = failure_stats = FailureStats()
+    get_driver_pool(size=concurrency + 1)  # One extra browser for the report PDF
+    report_future = None
+
+    topic_name = topic_url.rstrip("/").split("/")[-1]
+    summary = {"topic": topic_name, "topic_url": topic_url, "status": "failed"}
 
     log.info(f"🌐 Scraping topic page: {topic_url}")
-    response = session.get(topic_url)
-    if response.status_code != 200:
+    page = fetch_page(session, topic_url, cache=topic_page_cache)
+    if page.status_code != 200:
         log.error("❌ Failed to access topic page.")
-        return
+        summary["error"] = f"Topic page returned {page.status_code}"
+        return summary
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    topic_name = topic_url.rstrip("/").split("/")[-1]
     topic_folder = os.path.join(DEST_FOLDER, topic_name)
     os.makedirs(topic_folder, exist_ok=True)
     raw_file = os.path.join(topic_folder, f"{topic_name}_sections_raw.txt")
@@ -259,22 +505,30 @@ def scrape_topic(topic_url):
 
         # Report section
         log.info("\n===== REPORT SECTION =====")
-        explore_report_button = soup.find("a", class_="dossierTeaser__link")
+        explore_report_button = make_soup(page.text, REPORT_TEASER).find(
+            "a", class_="dossierTeaser__link"
+        )
         if explore_report_button:
             report_url = urljoin(
                 "https://www.statista.com", explore_report_button["href"]
             )
             log.info(f"🔗 'Explore this report' URL found: {report_url}")
-            download_report_with_selenium(report_url, topic_name)
+            report_future = report_executor.submit(
+                download_report_with_selenium, report_url, topic_name
+            )
         else:
             log.warning("⚠️ 'Explore this report' button not found on the topic page.")
 
         # Chapter & data scraping
         log.info("\n===== DATA SCRAPING SECTION =====")
-        sources_section = soup.find("section", id="statisticChapter")
+        sources_section = make_soup(page.text, STATISTIC_CHAPTERS).find(
+            "section", id="statisticChapter"
+        )
         if not sources_section:
             log.warning("⚠️ Sources section not found on the topic page.")
-            return
+            summary["error"] = "Sources section not found"
+            summary["report"] = wait_for_report(report_future)
+            return summary
 
         chapters = sources_section.find_all("div", class_="statisticChapter")
         section_urls = []
@@ -323,139 +577,237 @@ def scrape_topic(topic_url):
                 section_urls.append(section_url.strip())
 
     # Update total files count early
+    section_urls = list(dict.fromkeys(section_urls))  # Drop duplicates, keep order
     files_to_be_downloaded = len(section_urls)
     log.info(f"📊 Total files to be downloaded: {files_to_be_downloaded}")
 
+    # Skip sections a previous run already downloaded
+    manifest = ScrapeManifest(topic_folder)
+    pending_urls = manifest.pending(
+        section_urls, lambda url: section_file_path(topic_folder, url)
+    )
+    if len(pending_urls) < len(section_urls):
+        log.info(
+            f"⏭️ Resuming: {len(section_urls) - len(pending_urls)} sections already "
+            f"downloaded, {len(pending_urls)} remaining."
+        )
+
+    def download_section(section_url):
+        digest = download_xlsx(
+            section_url, topic_folder, stats=stats, queued_at=queued_at
+        )
+        if digest:
+            manifest.mark_done(
+                section_url, section_file_path(topic_folder, section_url), digest
+            )
+        else:
+            manifest.mark_failed(section_url, stats.failures.get(section_url))
+        return digest is not None
+
     # Download all XLSX files
-    log.info("🔄 Starting XLSX file download for all available section URLs...")
-    with tqdm(
-        total=files_to_be_downloaded, desc="Downloading XLSX files", unit="file"
-    ) as pbar:
-        for section_url in section_urls:
-            download_xlsx(section_url, topic_folder, pbar)
+    log.info(
+        f"🔄 Starting XLSX file download for all available section URLs "
+        f"({concurrency} at a time)..."
+    )
+    queued_at = time.monotonic()  # Every section is queued at once
+    progress = run_concurrently(
+        download_section,
+        pending_urls,
+        concurrency=concurrency,
+        desc="Downloading XLSX files",
+    )
 
-        # Log failed downloads
-    if failed_downloads:
-        log.warning(f"⚠️ Failed downloads ({len(failed_downloads)}):")
-        for failed_url in failed_downloads:
-            log.warning(f"  - {failed_url}")
+    get_driver_pool().log_stats()
+
+    # Log failed downloads
+    if stats.failed_count:
+        log.warning(f"⚠️ Failed downloads ({stats.failed_count}):")
+        for failed_url, kind in stats.failures.items():
+            log.warning(f"  - {failed_url} ({kind})")
+    log.info(f"📊 Failure statistics: {stats.summary()}")
+    storage = blob_store.stats()
+    log.info(
+        f"🔗 Storage: {storage['linked']} files linked instead of downloaded, "
+        f"{storage['deduplicated']} duplicates merged, {storage['blobs']} unique "
+        f"files ({storage['stored_bytes'] / 1e6:.1f} MB) in the store."
+    )
+
+    summary.update(
+        status="ok" if not progress.failed else "partial",
+        sections=len(section_urls),
+        skipped=len(section_urls) - len(pending_urls),
+        downloaded=progress.succeeded,
+        failed=progress.failed,
+        failures=stats.summary(),
+        report=wait_for_report(report_future),
+    )
+    return summary
+
+
+def section_file_path(base_folder, section_url, subfolder="topic sections"):
+    """Return where the XLSX file of a section URL is saved."""
+    url_slug = section_url.rstrip("/").split("/")[-1]
+    return os.path.join(base_folder, subfolder, f"{url_slug}.xlsx")
 
 
 def download_xlsx(
-    section_url, base_folder, pbar, subfolder="topic sections", retry_count=0
+    section_url,
+    base_folder,
+    pbar=None,
+    subfolder="topic sections",
+    stats=None,
+    queued_at=None,
 ):
-    """Download the XLSX file from the section URL and handle errors gracefully."""
-    global failed_downloads, failed
+    """Download the XLSX file from the section URL and handle errors gracefully.
+    Failures are recorded in `stats` (defaults to the current run's statistics).
+    :param queued_at: time.monotonic() when the download was queued, for telemetry.
+    Returns the SHA-256 of the saved file, or None if it could not be saved."""
+    stats = stats or failure_stats
+    sample = telemetry.start(section_url, queued_at)
 
     # Ensure the subfolder exists
     save_folder = os.path.join(base_folder, subfolder)
     os.makedirs(save_folder, exist_ok=True)
+    save_path = section_file_path(base_folder, section_url, subfolder)
+
+    # Already downloaded for another topic: link the stored copy
+    digest = blob_store.link(section_url, save_path)
+    if digest:
+        sample.method = "linked"
+        telemetry.finish(sample, "success")
+        log.info(f"🔗 XLSX file linked from the store: {os.path.basename(save_path)}")
+        if pbar is not None:
+            pbar.update(1)
+        return digest
+
+    # Fast path: a single HTTP request with the logged-in session
+    sample.method = "direct"
+    if (
+        DIRECT_DOWNLOADS
+        and direct_links.enabled
+        and download_xlsx_direct(session, section_url, save_path, sample, direct_links)
+    ):
+        digest = blob_store.add(save_path, section_url)
+        telemetry.finish(sample, "success")
+        log.info(f"📂 XLSX file saved: {os.path.basename(save_path)}")
+        if pbar is not None:
+            pbar.update(1)
+        return digest
 
-    driver = setup_driver()
+    sample.method = "browser"
+    sample.ttfb = sample.bytes = None  # Only describe the attempt that counts
     try:
-        # Transfer cookies from the session to Selenium
-        driver.get("https://www.statista.com/")  # Set domain for cookies
-        for cookie in session.cookies:
-            cookie_dict = {
-                "name": cookie.name,
-                "value": cookie.value,
-                # Force the domain to match exactly the site you have open
-                "domain": "www.statista.com",
-                "path": "/",
-            }
-            driver.add_cookie(cookie_dict)
-        time.sleep(3)
-        driver.refresh()  # Refresh to ensure cookies are applied
-
-        # Navigate to the section URL and initiate download
-        # log.info(f"🔄 Navigating to section URL: {section_url}")
-        driver.get(section_url)
-
-        # Locate and click the XLS button
-        try:
-            xls_button = WebDriverWait(driver, 20).until(
-                EC.element_to_be_clickable(
-                    (
-                        By.XPATH,
-                        "//button[contains(@data-paywall-info-box-track, 'paywall_c2a--xls')]",
-                    )
+        run_with_retry(
+            lambda: download_xlsx_with_selenium(section_url, save_path, sample),
+            DOWNLOAD_RETRY_POLICY,
+            stats,
+            label=section_url,
+        )
+    except DownloadError as e:
+        log.error(f"❌ Giving up on {section_url} ({e.kind}): {e}")
+        stats.record_failure(section_url, e.kind)
+        telemetry.finish(sample, e.kind)
+        return None
+
+    digest = blob_store.add(save_path, section_url)
+    telemetry.finish(sample, "success")
+    log.info(f"📂 XLSX file saved: {os.path.basename(save_path)}")
+    if pbar is not None:
+        pbar.update(1)
+    return digest
+
+
+def download_xlsx_with_selenium(section_url, save_path, sample=None):
+    """Make a single browser attempt at downloading a section's XLSX file.
+    :param sample: Optional telemetry sample receiving navigation time and size."""
+    failure = None
+
+    # Borrow a warm, already authenticated browser from the pool
+    with get_driver_pool().driver() as driver:
+        # Each download lands in its own folder, so parallel workers never collide
+        with isolated_download_dir(driver) as download_dir:
+            # Navigate to the section URL and initiate download
+            navigation = navigate(driver, section_url)
+            if sample is not None:
+                sample.navigation = navigation
+
+            # Locate and click the XLS button
+            try:
+                xls_button = WebDriverWait(driver, 20).until(
+                    EC.element_to_be_clickable((By.XPATH, XLS_BUTTON_XPATH))
                 )
-            )
-            xls_button.click()
-            # Wait until the file appears in the download folder
-            WebDriverWait(driver, 30).until(
-                lambda d: glob.glob(os.path.join(DEST_FOLDER, "*.xls*"))
-            )
-        except Exception as e:
-            log.error(f"❌ Failed to locate or click XLSX download button: {e}")
-            raise
-
-    except Exception as e:
-        log.error(f"❌ Error during XLSX download from {section_url}: {e}")
-        if retry_count < MAX_RETRIES:
-            log.info(f"🔄 Retrying ({retry_count + 1}/{MAX_RETRIES})...")
-            return download_xlsx(
-                section_url, base_folder, pbar, subfolder, retry_count + 1
-            )
-        else:
-            failed_downloads.append(section_url)
-            failed += 1
-            return
-    finally:
-        driver.quit()
+            except TimeoutException:
+                failure = explain_missing_xls_button(driver)
+            else:
+                xls_button.click()
+                # Wait until the download has fully completed
+                downloaded_file = wait_for_download(
+                    download_dir, ("*.xls*",), timeout=30
+                )
+                # Move the file to the appropriate folder
+                shutil.move(downloaded_file, save_path)
+                if sample is not None:
+                    sample.bytes = os.path.getsize(save_path)
+
+    # Raised outside the pool block: the browser itself is healthy and can be reused
+    if failure is not None:
+        raise failure
+
+
+def explain_missing_xls_button(driver):
+    """
+    Classify why a statistic page offers no clickable XLS button. Only a
+    visible paywall box without any XLS button counts as NO_ACCESS, which is
+    never retried; a button that is there but not clickable yet is a TIMEOUT.
+    """
+    if "/login" in driver.current_url:
+        return DownloadError(SESSION_EXPIRED, "Redirected to the login page.")
+    if driver.find_elements(By.XPATH, XLS_BUTTON_XPATH):
+        return DownloadError(TIMEOUT, "XLS download button did not become clickable.")
+    if any(
+        box.is_displayed()
+        for box in driver.find_elements(By.CSS_SELECTOR, PAYWALL_SELECTOR)
+    ):
+        return DownloadError(NO_ACCESS, "Statistic is behind a paywall.")
+    return DownloadError(MISSING_BUTTON, "XLS download button not found.")
 
-    # Rename the downloaded file
-    try:
-        url_slug = section_url.rstrip("/").split("/")[-1]
-        downloaded_files = glob.glob(os.path.join(DEST_FOLDER, "*.xls*"))
-        if not downloaded_files:
-            log.warning(f"⚠️ No downloaded file found for section: {url_slug}")
-            return
 
-        # Move the file to the appropriate folder
-        downloaded_file = max(downloaded_files, key=os.path.getctime)
-        save_path = os.path.join(save_folder, f"{url_slug}.xlsx")
-        shutil.move(downloaded_file, save_path)
-        log.info(f"📂 XLSX file saved: {os.path.basename(save_path)}")
-        pbar.update(1)
-    except Exception as e:
-        log.error(f"❌ Failed to rename the downloaded file: {e}")
+def get_failed_downloads():
+    """Return the number of failed downloads in the current run."""
+    return failure_stats.failed_count
 
 
-def get_failed_downloads():
-    """Return the list of failed download URLs."""
-    return failed
+def wait_for_report(report_future):
+    """Join a background report download.
+    :return: "downloaded", "failed", or "skipped" when no report was requested."""
+    if report_future is None:
+        return "skipped"
+    if not report_future.done():
+        log.info("⏳ Waiting for the report PDF download to finish...")
+    try:
+        saved = report_future.result()
+    except Exception as e:
+        log.error(f"❌ Report download failed: {e}")
+        saved = False
+    log.info(f"📄 Report PDF: {'downloaded' if saved else 'failed'}")
+    return "downloaded" if saved else "failed"
 
 
 def download_report_with_selenium(report_url, topic_name):
-    """Redirect to 'Explore this report' URL, open the Download dropdown, and click the PDF option."""
-    driver = setup_driver()
+    """Redirect to 'Explore this report' URL, open the Download dropdown, and click the PDF option.
+    Returns True when the report was saved."""
     topic_folder = os.path.join(DEST_FOLDER, topic_name)
     os.makedirs(topic_folder, exist_ok=True)
     report_file_path = os.path.join(topic_folder, f"report_{topic_name}.pdf")
 
-    try:
-        # Transfer cookies from the session to the Selenium driver
-        log.info("🔄 Transferring session cookies to Selenium browser...")
-        driver.get(
-            "https://www.statista.com/"
-        )  # Open a page to set the domain for cookies
-        for cookie in session.cookies:
-            cookie_dict = {
-                "name": cookie.name,
-                "value": cookie.value,
-                # Force the domain to match exactly the site you have open
-                "domain": "www.statista.com",
-                "path": "/",
-            }
-            driver.add_cookie(cookie_dict)
-        time.sleep(3)
-        driver.refresh()  # Refresh to ensure cookies are applied
-        log.info("✅ Cookies transferred successfully.")
-
+    # Borrow a warm, already authenticated browser from the pool
+    with (
+        get_driver_pool().driver() as driver,
+        isolated_download_dir(driver) as download_dir,
+    ):
         # Redirect to the report page
         log.info(f"🔄 Redirecting to report page: {report_url}")
-        driver.get(report_url)
+        navigate(driver, report_url)
 
         # Hover over the Download button
         try:
@@ -466,7 +818,7 @@ def download_report_with_selenium(report_url, topic_name):
             action.move_to_element(download_button).perform()
         except Exception as e:
             log.error(f"❌ Failed to hover over the Download button: {e}")
-            return
+            return False
 
         # Wait for the dropdown to appear and click the PDF option
         try:
@@ -475,29 +827,20 @@ def download_report_with_selenium(report_url, topic_name):
             )
             driver.execute_script("arguments[0].click();", pdf_option)
             log.info("🔄 PDF download initiated.")
-            # Wait until the file appears in the download folder
-            WebDriverWait(driver, 30).until(
-                lambda d: glob.glob(os.path.join(DEST_FOLDER, "*.pdf"))
-            )
+            # Wait until the download has fully completed
+            downloaded_file = wait_for_download(download_dir, ("*.pdf",), timeout=30)
         except Exception as e:
             log.error(f"❌ Failed to locate or click the PDF download option: {e}")
-            return
-    finally:
-        driver.quit()
+            return False
 
-    # Rename the downloaded file
-    try:
-        downloaded_files = glob.glob(os.path.join(DEST_FOLDER, "*.pdf"))
-        if not downloaded_files:
-            log.warning("⚠️ No downloaded file found.")
-            return
-
-        # Assume the most recently downloaded file is the target
-        downloaded_file = max(downloaded_files, key=os.path.getctime)
-        shutil.move(downloaded_file, report_file_path)
-        log.info(f"📂 Report saved successfully at: {report_file_path}")
-    except Exception as e:
-        log.error(f"❌ Failed to rename the downloaded file: {e}")
+        # Rename the downloaded file
+        try:
+            shutil.move(downloaded_file, report_file_path)
+            log.info(f"📂 Report saved successfully at: {report_file_path}")
+            return True
+        except Exception as e:
+            log.error(f"❌ Failed to rename the downloaded file: {e}")
+            return False
 
 
 def clean_and_reformat_file(input_file, output_file):
@@ -528,16 +871,28 @@ def clean_and_reformat_file(input_file, output_file):
 
 def get_files_to_be_downloaded(topic_url):
     log.info(f"Analyzing files to be downloaded for topic: {topic_url}")
-    response = session.get(topic_url)
-    if response.status_code != 200:
-        log.error("❌ Failed to access topic page.")
-        return []
+    return count_section_files(fetch_page(session, topic_url, cache=topic_page_cache))
 
-    soup = BeautifulSoup(response.text, "html.parser")
+
+def get_files_to_be_downloaded_many(topic_urls, concurrency=FETCH_CONCURRENCY):
+    """Count the files to be downloaded for many topics, fetching their pages concurrently."""
+    topic_urls = list(topic_urls)
+    log.info(f"Analyzing files to be downloaded for {len(topic_urls)} topics...")
+    pages = fetch_pages(session, topic_urls, concurrency, cache=topic_page_cache)
+    return {page.url: count_section_files(page) for page in pages}
+
+
+def count_section_files(page):
+    """Count the section files listed on a fetched topic page."""
+    if page.status_code != 200:
+        log.error(f"❌ Failed to access topic page: {page.url}")
+        return 0
+
+    soup = make_soup(page.text, STATISTIC_CHAPTERS)
     sources_section = soup.find("section", id="statisticChapter")
     if not sources_section:
         log.warning("⚠️ Sources section not found on the topic page.")
-        return []
+        return 0
 
     section_urls = [
         urljoin("https://www.statista.com", link["href"])
@@ -548,8 +903,28 @@ def get_files_to_be_downloaded(topic_url):
     return len(section_urls) // 2
 
 
+def parse_args(argv=None):
+    """Parse command-line options for the interactive scraper."""
+    parser = argparse.ArgumentParser(description="Statista topic scraper.")
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Number of section downloads running at the same time.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached search results and search the live site.",
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """Main function to execute the scraper."""
+    args = parse_args()
+    configure_logging()
     log.info("=" * 80)
     log.info("                       STATISTA SCRAPER - OPERATION LOG")
     log.info("=" * 80)
@@ -558,11 +933,11 @@ def main():
     try:
         # LOGIN SECTION
         log.info("\n===== LOGIN SECTION =====")
-        if login_with_selenium(driver):
+        if ensure_logged_in(driver):
             # TOPIC SEARCH SECTION
             log.info("\n===== TOPIC SEARCH SECTION =====")
             topic = input("Enter the topic to search (e.g., France): ").strip()
-            selected_topics = search_topic(topic)
+            selected_topics = cached_search_topic(driver, topic, refresh=args.refresh)
 
             if not selected_topics:
                 log.warning("⚠️ No topics found for your search. Please try again.")
@@ -587,13 +962,13 @@ def main():
                         # Process all topics
                         for topic_name, topic_url in selected_topics:
                             log.info(f"\n===== SCRAPING TOPIC: {topic_name} =====")
-                            scrape_topic(topic_url)
+                            scrape_topic(topic_url, args.concurrency)
                         break
                     elif choice.isdigit() and 1 <= int(choice) <= len(selected_topics):
                         # Process the selected topic
                         topic_name, topic_url = selected_topics[int(choice) - 1]
                         log.info(f"\n===== SCRAPING TOPIC: {topic_name} =====")
-                        scrape_topic(topic_url)
+                        scrape_topic(topic_url, args.concurrency)
                         break
                     else:
                         print("Invalid choice. Please try again.")
@@ -602,7 +977,10 @@ def main():
         else:
             log.error("❌ Login failed. Exiting.")
     finally:
+        close_driver_pool()
         driver.quit()
+        if telemetry.report()["downloads"]:
+            telemetry.write_report(TELEMETRY_REPORT)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+"""
+Compare browser page-load times with the default and the lean Chrome profile.
+
+Usage (from the repository root):
+    python scripts/benchmark_page_load.py [url ...] [--repeat N]
+
+Each URL is opened `--repeat` times in a fresh headless browser per profile;
+the first load of every browser is cold, the others hit Chrome's cache.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from browser_profile import PageLoadStats  # noqa: E402
+from scraper import LOGIN_URL, SEARCH_URL, TOPICS_URL, setup_driver  # noqa: E402
+
+DEFAULT_URLS = [LOGIN_URL, TOPICS_URL, f"{SEARCH_URL}?q=France"]
+
+
+def time_profile(urls, lean, repeat):
+    stats = PageLoadStats()
+    driver = setup_driver(lean=lean)
+    try:
+        for _ in range(repeat):
+            for url in urls:
+                start = time.perf_counter()
+                driver.get(url)
+                stats.record(time.perf_counter() - start)
+    finally:
+        driver.quit()
+    return stats.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("urls", nargs="*", default=DEFAULT_URLS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'profile':<10} {'loads':>6} {'mean s':>8} {'median s':>9} {'p95 s':>7}")
+    for name, lean in (("default", False), ("lean", True)):
+        summary = time_profile(args.urls, lean, args.repeat)
+        print(
+            f"{name:<10} {summary['count']:>6} {summary['mean']:>8.2f} "
+            f"{summary['median']:>9.2f} {summary['p95']:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
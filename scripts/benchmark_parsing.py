@@ -0,0 +1,107 @@
+"""
+Micro-benchmark of HTML parsing backends on saved pages.
+
+Usage (from the repository root):
+    python scripts/benchmark_parsing.py [page.html ...] [--synthetic SECTIONS] [--repeat N]
+
+Without arguments it parses `page_source.html` plus a synthetic topic page, so
+the effect of targeted parsing on large pages is visible even without a saved
+topic page. Every targeted parse is also checked against the full parse: the
+"kept" column shows how many of the wanted elements survived the strainer.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from html_parser import (  # noqa: E402
+    SEARCH_RESULTS,
+    STATISTIC_CHAPTERS,
+    make_soup,
+)
+
+BACKENDS = ["html.parser", "lxml"]
+
+
+def synthetic_topic_page(sections):
+    """
+    Build a topic-like page: lots of unrelated markup around a chapter list and
+    a few search-result links that, like on the live site, carry several classes.
+    """
+    noise = "".join(
+        f'<div class="teaser"><p>Paragraph {i}</p><a href="/x/{i}">link</a></div>'
+        for i in range(sections * 5)
+    )
+    items = "".join(
+        f'<li class="statisticChapter__item"><a href="/statistics/{i}/s/">Section {i}</a></li>'
+        for i in range(sections)
+    )
+    chapter = f'<div class="statisticChapter"><h3>Chapter</h3><ul>{items}</ul></div>'
+    results = "".join(
+        f'<a class="resultList__itemBox resultList__itemBox--topic" href="/topics/{i}/t/">'
+        f'<div class="itemContent__text">Topic {i}</div></a>'
+        for i in range(10)
+    )
+    return (
+        f"<html><body>{noise}{results}"
+        f'<section id="statisticChapter">{chapter}</section>'
+        f"{noise}</body></html>"
+    )
+
+
+def time_parse(html, parser, strainer, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        soup = make_soup(html, parse_only=strainer, parser=parser)
+    return (time.perf_counter() - start) / repeat * 1000, soup
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="*", default=["page_source.html"])
+    parser.add_argument("--synthetic", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    fixtures = []
+    for path in args.files:
+        with open(path, "r", encoding="utf-8") as file:
+            fixtures.append((os.path.basename(path), file.read()))
+    if args.synthetic:
+        fixtures.append(
+            (
+                f"synthetic topic ({args.synthetic} sections)",
+                synthetic_topic_page(args.synthetic),
+            )
+        )
+
+    # (mode, strainer, CSS selector of the elements the strainer must keep)
+    modes = [
+        ("full", None, None),
+        ("chapters only", STATISTIC_CHAPTERS, "li.statisticChapter__item"),
+        ("search results only", SEARCH_RESULTS, "a.resultList__itemBox"),
+    ]
+
+    print(f"{'fixture':<40} {'backend':<12} {'mode':<20} {'ms/parse':>10} {'kept':>10}")
+    for name, html in fixtures:
+        for backend in BACKENDS:
+            full = None
+            for mode, strainer, selector in modes:
+                try:
+                    ms, soup = time_parse(html, backend, strainer, args.repeat)
+                except Exception as e:  # Backend not installed
+                    print(f"{name:<40} {backend:<12} {mode:<20} {'n/a':>10}  ({e})")
+                    break
+                if strainer is None:
+                    full = soup
+                    print(f"{name:<40} {backend:<12} {mode:<20} {ms:>10.2f}")
+                    continue
+                kept = f"{len(soup.select(selector))}/{len(full.select(selector))}"
+                print(f"{name:<40} {backend:<12} {mode:<20} {ms:>10.2f} {kept:>10}")
+
+
+if __name__ == "__main__":
+    main()
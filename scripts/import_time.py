@@ -0,0 +1,73 @@
+"""
+Report how long importing the project modules takes and whether it has side effects.
+
+Usage (from the repository root):
+    python scripts/import_time.py [module ...] [--top N]
+
+Every module is imported in a fresh interpreter with `python -X importtime`,
+inside an empty working directory, so files created at import time (logs,
+data folders, caches) show up in the report.
+"""
+
+import os
+import sys
+import tempfile
+import argparse
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+DEFAULT_MODULES = ["scraper", "advanced_search", "transform", "batch", "gui"]
+
+
+def measure(module):
+    """
+    Import `module` in a clean interpreter.
+    :return: (total import time in ms, [(cumulative ms, imported name)], created files, error)
+    """
+    with tempfile.TemporaryDirectory(prefix="statista-import-") as workdir:
+        env = dict(os.environ, PYTHONPATH=os.path.abspath(ROOT))
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=workdir,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        created = sorted(os.listdir(workdir))
+
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        timings.append((int(cumulative) / 1000, name.strip()))
+    total = next((ms for ms, name in timings if name == module), None)
+    error = result.stderr.strip().splitlines()[-1] if result.returncode else None
+    return total, timings, created, error
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        total, timings, created, error = measure(module)
+        if error:
+            print(f"{module}: import failed ({error})\n")
+            continue
+        print(f"{module}: {total:.1f} ms")
+        print(f"  side effects: {', '.join(created) if created else 'none'}")
+        top_level = [
+            (ms, name)
+            for ms, name in timings
+            if name != module and "." not in name and not name.startswith("_")
+        ]
+        for ms, name in sorted(top_level, reverse=True)[: args.top]:
+            print(f"  {ms:>9.1f} ms  {name}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import os
+import json
+import time
+import logging
+
+from sqlite_store import connect
+
+log = logging.getLogger()
+
+SEARCH_CACHE_DB = os.path.abspath(os.path.join(".cache", "search_cache.sqlite"))
+DEFAULT_TTL = 24 * 60 * 60  # Search results are reused for a day
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS search_results ("
+    " kind TEXT NOT NULL,"
+    " cache_key TEXT NOT NULL,"
+    " payload TEXT NOT NULL,"
+    " created_at REAL NOT NULL,"
+    " PRIMARY KEY (kind, cache_key))"
+)
+
+
+class SearchCache:
+    """
+    SQLite-backed cache of search results keyed by search kind, query and options.
+    A new connection is opened per call, so the cache is safe to share between
+    the GUI's callback threads and the CLI.
+    """
+
+    def __init__(self, path=SEARCH_CACHE_DB, ttl=DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+
+    def _connect(self):
+        return connect(self.path, SCHEMA)
+
+    @staticmethod
+    def make_key(query, **options):
+        """Normalise the query and options into a stable cache key."""
+        return json.dumps(
+            {"query": (query or "").strip().lower(), **options}, sort_keys=True
+        )
+
+    def get(self, kind, key):
+        """Return the cached payload, or None when missing or older than the TTL."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT payload, created_at FROM search_results"
+                " WHERE kind = ? AND cache_key = ?",
+                (kind, key),
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return json.loads(row[0])
+
+    def put(self, kind, key, payload):
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO search_results VALUES (?, ?, ?, ?)",
+                (kind, key, json.dumps(payload), time.time()),
+            )
+
+    def cached(self, kind, key, compute, refresh=False):
+        """
+        Return the cached result for `key`, or call `compute()` and store its result.
+        :param refresh: Ignore any cached value and search again.
+        """
+        if not refresh:
+            payload = self.get(kind, key)
+            if payload is not None:
+                log.info(f"⚡ Using cached {kind} results.")
+                return payload
+        payload = compute()
+        if payload:  # Do not remember empty (possibly failed) searches
+            self.put(kind, key, payload)
+        return payload
+
+    def clear(self, kind=None):
+        """Drop all cached results, or only those of one kind."""
+        with self._connect() as connection:
+            if kind:
+                connection.execute("DELETE FROM search_results WHERE kind = ?", (kind,))
+            else:
+                connection.execute("DELETE FROM search_results")
@@ -0,0 +1,118 @@
+import os
+import json
+import time
+import base64
+import hashlib
+import logging
+
+from cryptography.fernet import Fernet, InvalidToken
+
+log = logging.getLogger()
+
+SESSION_FILE = os.path.abspath(os.path.join(".cache", "session.bin"))
+# Page that redirects to the login form when the session is no longer valid
+SESSION_CHECK_URL = "https://www.statista.com/account/"
+MAX_SESSION_AGE = 12 * 60 * 60  # Force a full login after 12 hours
+SALT_SIZE = 16
+KDF_ITERATIONS = 200_000
+
+
+def _fernet(salt):
+    """
+    Build the cipher from STATISTA_SESSION_KEY, or derive it from the account
+    password, so the cookie file is useless without the local credentials.
+    """
+    secret = os.getenv("STATISTA_SESSION_KEY") or os.getenv("STATISTA_PASSWORD")
+    if not secret:
+        return None
+    key = hashlib.pbkdf2_hmac("sha256", secret.encode("utf-8"), salt, KDF_ITERATIONS)
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def save_session(cookies, path=SESSION_FILE):
+    """Encrypt and store Selenium-style cookie dicts together with the save time."""
+    salt = os.urandom(SALT_SIZE)
+    fernet = _fernet(salt)
+    if fernet is None:
+        log.warning(
+            "⚠️ Session not persisted: set STATISTA_PASSWORD or STATISTA_SESSION_KEY."
+        )
+        return False
+
+    payload = json.dumps({"saved_at": time.time(), "cookies": cookies})
+    token = fernet.encrypt(payload.encode("utf-8"))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(salt + token)
+    os.chmod(temp_path, 0o600)
+    os.replace(temp_path, path)
+    log.info("💾 Session cookies stored for the next run.")
+    return True
+
+
+def load_session(path=SESSION_FILE):
+    """Return the stored, non-expired cookies, or None if the session is stale."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+        fernet = _fernet(data[:SALT_SIZE])
+        if fernet is None:
+            return None
+        stored = json.loads(fernet.decrypt(data[SALT_SIZE:]))
+    except (OSError, ValueError, InvalidToken) as e:
+        log.warning(f"⚠️ Stored session could not be read: {e!r}")
+        return None
+
+    now = time.time()
+    if now - stored["saved_at"] > MAX_SESSION_AGE:
+        log.info("⌛ Stored session is too old.")
+        return None
+    cookies = [c for c in stored["cookies"] if c.get("expiry", now + 1) > now]
+    if not cookies:
+        log.info("⌛ Stored session cookies have expired.")
+        return None
+    return cookies
+
+
+def clear_session(path=SESSION_FILE):
+    """Forget the stored session."""
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def is_session_valid(session, timeout=15):
+    """Check with a single request that the HTTP session is still logged in."""
+    try:
+        response = session.get(SESSION_CHECK_URL, timeout=timeout)
+    except Exception as e:
+        log.warning(f"⚠️ Session check failed: {e}")
+        return False
+    return response.status_code == 200 and "/login" not in response.url
+
+
+def restore_session(session, path=SESSION_FILE):
+    """
+    Load stored cookies into a requests session and validate them.
+    :return: True if the session is logged in and no full login is needed.
+    """
+    cookies = load_session(path)
+    if not cookies:
+        return False
+    for cookie in cookies:
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain"),
+            path=cookie.get("path", "/"),
+        )
+    if not is_session_valid(session):
+        log.info("⌛ Stored session was rejected by the server.")
+        session.cookies.clear()
+        clear_session(path)
+        return False
+    log.info("🔓 Reusing stored session, skipping the login flow.")
+    return True
@@ -0,0 +1,33 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+_created = set()  # Database paths whose schema exists
+_lock = threading.Lock()
+
+
+@contextmanager
+def connect(path, schema):
+    """
+    Yield a connection to the SQLite database at `path` that is committed and
+    closed afterwards. The `schema` script (CREATE ... IF NOT EXISTS statements)
+    runs once per database and process, not on every connection.
+    """
+    with _lock:
+        if path not in _created or not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            connection = sqlite3.connect(path, timeout=10)
+            try:
+                with connection:
+                    connection.executescript(schema)
+            finally:
+                connection.close()
+            _created.add(path)
+
+    connection = sqlite3.connect(path, timeout=10)
+    try:
+        with connection:
+            yield connection
+    finally:
+        connection.close()
@@ -0,0 +1,173 @@
+import json
+import time
+import logging
+import threading
+from collections import Counter
+
+log = logging.getLogger()
+
+METRIC_PREFIX = "statista_download"
+SECONDS_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+BYTES_BUCKETS = (1e3, 1e4, 5e4, 1e5, 2.5e5, 5e5, 1e6, 5e6, 1e7, 5e7)
+
+
+class Histogram:
+    """Fixed-bucket histogram in the Prometheus sense (cumulative `le` buckets)."""
+
+    def __init__(self, name, description, buckets):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)  # Per bucket, not cumulative
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self):
+        """Yield (upper bound, observations <= bound), ending with +Inf."""
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+        yield float("inf"), self.count
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "mean": round(self.sum / self.count, 3) if self.count else None,
+            "buckets": {
+                _format_bound(bound): count for bound, count in self.cumulative()
+            },
+        }
+
+    def prometheus(self):
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for bound, count in self.cumulative():
+            lines.append(f'{self.name}_bucket{{le="{_format_bound(bound)}"}} {count}')
+        lines.append(f"{self.name}_sum {self.sum:.6f}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+
+def _format_bound(bound):
+    return "+Inf" if bound == float("inf") else f"{bound:g}"
+
+
+class DownloadSample:
+    """
+    Timings of one download, filled in by the code paths it passes through.
+    Phases that did not happen (e.g. TTFB of a browser download) stay None.
+    """
+
+    def __init__(self, url, queued_at=None):
+        self.url = url
+        self.started = time.monotonic()
+        self.queue_wait = self.started - queued_at if queued_at is not None else None
+        self.navigation = None  # Opening the statistic page (browser or HTTP)
+        self.ttfb = None  # Request sent until response headers received
+        self.bytes = None
+        self.method = None  # "direct" or "browser"
+
+
+class DownloadTelemetry:
+    """
+    Aggregate per-download samples into histograms and outcome counters. The
+    numbers accumulate for the lifetime of the process, as Prometheus expects.
+    """
+
+    def __init__(self):
+        self.histograms = {
+            "queue_wait": Histogram(
+                f"{METRIC_PREFIX}_queue_wait_seconds",
+                "Time a download waited for a free worker.",
+                SECONDS_BUCKETS,
+            ),
+            "navigation": Histogram(
+                f"{METRIC_PREFIX}_navigation_seconds",
+                "Time spent opening the statistic page.",
+                SECONDS_BUCKETS,
+            ),
+            "ttfb": Histogram(
+                f"{METRIC_PREFIX}_ttfb_seconds",
+                "Time to first byte of direct file downloads.",
+                SECONDS_BUCKETS,
+            ),
+            "bytes": Histogram(
+                f"{METRIC_PREFIX}_size_bytes",
+                "Size of downloaded files.",
+                BYTES_BUCKETS,
+            ),
+            "latency": Histogram(
+                f"{METRIC_PREFIX}_latency_seconds",
+                "Total time per download, retries included.",
+                SECONDS_BUCKETS,
+            ),
+        }
+        self.outcomes = Counter()  # (method, outcome) -> count
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def start(self, url, queued_at=None):
+        """Begin a sample; `queued_at` is the time.monotonic() the task was queued."""
+        return DownloadSample(url, queued_at)
+
+    def finish(self, sample, outcome):
+        """Record a finished download with its outcome ("success" or a failure kind)."""
+        latency = time.monotonic() - sample.started
+        values = {
+            "queue_wait": sample.queue_wait,
+            "navigation": sample.navigation,
+            "ttfb": sample.ttfb,
+            "bytes": sample.bytes,
+            "latency": latency,
+        }
+        with self._lock:
+            for key, value in values.items():
+                if value is not None:
+                    self.histograms[key].observe(value)
+            self.outcomes[(sample.method or "none", outcome)] += 1
+
+    def report(self):
+        """JSON-serialisable snapshot of all histograms and outcome counts."""
+        with self._lock:
+            return {
+                "since": time.strftime(
+                    "%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)
+                ),
+                "downloads": sum(self.outcomes.values()),
+                "outcomes": [
+                    {"method": method, "outcome": outcome, "count": count}
+                    for (method, outcome), count in sorted(self.outcomes.items())
+                ],
+                **{key: hist.snapshot() for key, hist in self.histograms.items()},
+            }
+
+    def write_report(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.report(), file, indent=2)
+        log.info(f"📈 Download telemetry written to {path}")
+
+    def prometheus(self):
+        """Render the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            lines = []
+            for hist in self.histograms.values():
+                lines.extend(hist.prometheus())
+            lines.append(f"# HELP {METRIC_PREFIX}s_total Finished downloads.")
+            lines.append(f"# TYPE {METRIC_PREFIX}s_total counter")
+            for (method, outcome), count in sorted(self.outcomes.items()):
+                lines.append(
+                    f'{METRIC_PREFIX}s_total{{method="{method}",outcome="{outcome}"}} {count}'
+                )
+        return "\n".join(lines) + "\n"
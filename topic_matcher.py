@@ -0,0 +1,72 @@
+from rapidfuzz import fuzz, process, utils
+
+from denonyms import get_demonym
+
+EXACT_MATCH_SCORE = 99  # Title equals the query or its demonym
+CLOSE_MATCH_SCORE = 85  # Query or demonym appears as a whole in the title
+
+# Labels and colours shown for each match class in the GUI
+MATCH_COLORS = {
+    "Exact match": "#28a745",
+    "Close match": "#ffc107",
+    "Somewhat match": "#dc3545",
+}
+
+
+def match_label(score):
+    """Map a 0-100 similarity score to a match class."""
+    if score >= EXACT_MATCH_SCORE:
+        return "Exact match"
+    if score >= CLOSE_MATCH_SCORE:
+        return "Close match"
+    return "Somewhat match"
+
+
+class TopicMatcher:
+    """
+    Score topic titles against a query and its demonym (e.g. "France" and
+    "French") in one vectorised rapidfuzz call.
+    """
+
+    def __init__(self, query):
+        self.query = query
+        demonym = get_demonym(query) if query else None
+        self.queries = [
+            utils.default_process(text) for text in (query, demonym) if text
+        ]
+        # Filter words keep their punctuation: default_process would turn
+        # "U.S." into "u" and "s", which occur in almost every title
+        self.words = {
+            word for text in (query, demonym) if text for word in text.lower().split()
+        }
+
+    def is_relevant(self, title):
+        """Strict filter: a word of the query or of its demonym occurs in the title."""
+        title = title.lower()
+        return any(word in title for word in self.words)
+
+    def scores(self, titles):
+        """Return the best similarity (0-100) of each title to the query or demonym."""
+        if not titles or not self.queries:
+            return [0.0] * len(titles)
+        matrix = process.cdist(
+            self.queries,
+            titles,
+            scorer=fuzz.WRatio,
+            processor=utils.default_process,
+            workers=-1,
+        )
+        return matrix.max(axis=0).tolist()
+
+    def rank(self, topics):
+        """
+        Rank (title, url) pairs by similarity, best first.
+        :return: List of (title, url, score, match label).
+        """
+        topics = list(topics)
+        scores = self.scores([title for title, _ in topics])
+        ranked = [
+            (title, url, score, match_label(score))
+            for (title, url), score in zip(topics, scores)
+        ]
+        return sorted(ranked, key=lambda topic: topic[2], reverse=True)
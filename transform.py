@@ -10,15 +10,6 @@ from datetime import datetime
 
 warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("scraper.log", mode="w", encoding="utf-8"),
-    ],
-)
 log = logging.getLogger()
 
 